@@ -98,6 +98,9 @@ LEVEL_UP_MESSAGES = [
 # Game settings
 MAX_INVENTORY_SIZE = 20
 SAVE_DIRECTORY = "storage/saves"
+PRETTY_SAVES = False  # Indent save files for hand-inspection (larger, slower)
+MAX_SESSIONS = 1000  # Active games kept in memory; least recently used go first
+SESSION_TTL = 3600  # Seconds an idle session's game is kept in memory
 REST_HP_RECOVERY = 0.5  # 50% of max HP
 REST_MP_RECOVERY = 0.75  # 75% of max MP
 REST_ENCOUNTER_CHANCE = 0.20  # 20% chance
@@ -0,0 +1,1505 @@
+"""
+Integration Quest: The Workato RPG
+Game tool implementations
+
+Plain functions behind every MCP tool. They don't depend on FastMCP, so the
+terminal client can import them without paying for the server stack;
+server.py registers them as MCP tools.
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import random
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Literal, Optional, Dict, Tuple
+from datetime import datetime
+from pydantic_core import from_json
+
+# Import models
+from models.hero import Hero, StatusEffect
+from models.world import GameState, Room
+from models.items import (
+    Weapon, Armor, Consumable, ConsumableEffect, EquipmentSlots, InventoryItem, LootItem, item_tag
+)
+from models.combat import CombatState, Enemy
+
+# Import systems
+from systems.combat import CombatSystem
+from systems.generation import DungeonGenerator
+from systems.progression import ProgressionSystem
+from systems.effects import StatusEffectManager
+
+# Import config
+from config import (
+    CLASS_BONUSES, BASE_STATS, ERRORS, VICTORY_MESSAGES,
+    GAME_OVER_MESSAGES, REST_HP_RECOVERY, REST_MP_RECOVERY,
+    REST_ENCOUNTER_CHANCE, FLEE_BASE_CHANCE, PRETTY_SAVES, SAVE_DIRECTORY,
+    MAX_SESSIONS, SESSION_TTL
+)
+
+
+class SessionCache(MutableMapping):
+    """Games by session id, dropping the least recently used and idle ones
+
+    Every lookup or store refreshes a session's expiry, so entries stay ordered
+    by expiry and eviction only ever looks at the front. Pinned sessions are
+    never evicted. on_evict is called (outside the lock) with each evicted
+    session id, so per-session data kept elsewhere can be dropped with it.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        pinned: Tuple[str, ...] = (),
+        timer: Callable[[], float] = time.monotonic,
+        on_evict: Optional[Callable[[str], None]] = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._pinned = frozenset(pinned)
+        self._timer = timer
+        self._on_evict = on_evict
+        self._entries: OrderedDict[str, Tuple[float, GameState]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, session_id: str) -> GameState:
+        now = self._timer()
+        with self._lock:
+            expires, game_state = self._entries[session_id]
+            expired = expires <= now and session_id not in self._pinned
+            if expired:
+                del self._entries[session_id]
+            else:
+                self._entries[session_id] = (now + self.ttl, game_state)
+                self._entries.move_to_end(session_id)
+        if expired:
+            self._evicted([session_id])
+            raise KeyError(session_id)
+        return game_state
+
+    def __setitem__(self, session_id: str, game_state: GameState) -> None:
+        now = self._timer()
+        with self._lock:
+            self._entries[session_id] = (now + self.ttl, game_state)
+            self._entries.move_to_end(session_id)
+            victims = self._evict(now)
+        self._evicted(victims)
+
+    def __delitem__(self, session_id: str) -> None:
+        with self._lock:
+            del self._entries[session_id]
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self, now: float) -> List[str]:
+        """Drop expired sessions, then the oldest ones over maxsize (lock held)"""
+        excess = len(self._entries) - self.maxsize
+        victims = []
+        for session_id, (expires, _) in self._entries.items():
+            if session_id in self._pinned:
+                continue
+            if excess <= 0 and expires > now:
+                break
+            victims.append(session_id)
+            excess -= 1
+        for session_id in victims:
+            del self._entries[session_id]
+        return victims
+
+    def _evicted(self, session_ids: List[str]) -> None:
+        """Report evicted sessions to on_evict (lock not held)"""
+        if self._on_evict is not None:
+            for session_id in session_ids:
+                self._on_evict(session_id)
+
+
+# Game state storage (in-memory, keyed by session). The local single-player
+# game lives in the default session, which is never evicted
+DEFAULT_SESSION = "default"
+game_states = SessionCache(
+    MAX_SESSIONS, SESSION_TTL, pinned=(DEFAULT_SESSION,),
+    on_evict=lambda session_id: _LAST_SAVE.pop(session_id, None)
+)
+
+# Initialize dungeon generator
+dungeon_gen = DungeonGenerator()
+
+# Chance rolls: uniform float in [0, 1), what roll_percentage() returns, without the wrapper call
+_roll_chance = random.random
+_choice = random.choice
+_now = datetime.now
+
+# Flavour text pools, as tuples for random.choice
+_VICTORY_MESSAGES = tuple(VICTORY_MESSAGES)
+_GAME_OVER_MESSAGES = tuple(GAME_OVER_MESSAGES)
+
+# Save files are written off the request path by a single background writer
+_SAVE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save-writer")
+_PENDING_SAVES: Dict[Path, Future] = {}
+# Guards _PENDING_SAVES, which the writer thread's done-callbacks also touch
+_PENDING_SAVES_LOCK = threading.Lock()
+# Per session: (hash of the state as last saved, save_id it was saved under).
+# Entries go when game_states evicts the session
+_LAST_SAVE: Dict[str, Tuple[str, str]] = {}
+
+# Filesystem locations, resolved once
+_DATA_DIR = Path(__file__).parent / "data"
+_SAVES_DIR = Path(__file__).parent / SAVE_DIRECTORY
+
+# Static game data, parsed once per process
+_ITEMS_DATA = from_json((_DATA_DIR / "items.json").read_bytes())
+_SKILLS_DATA = from_json((_DATA_DIR / "skills.json").read_bytes())
+
+# Starting kit shared by every new hero. Item models are never mutated after
+# creation, so the same instances can be equipped by all heroes. Validated
+# (once) so enum fields hold enum members and serialize cleanly.
+_STARTING_WEAPON = Weapon.model_validate(_ITEMS_DATA["weapons"][0])  # HTTP Client
+_STARTING_ARMOR = Armor.model_validate(_ITEMS_DATA["armor"][0])  # Basic Logging
+_STARTER_POTION = Consumable.model_validate(_ITEMS_DATA["consumables"][0])  # Job Retry Potion
+_ROLE_SKILLS = {role: [skill["id"] for skill in _SKILLS_DATA[role]] for role in CLASS_BONUSES}
+_SKILLS_BY_ID = {skill["id"]: skill for role_skills in _SKILLS_DATA.values() for skill in role_skills}
+
+# Role descriptions
+_ROLE_NAMES = {
+    "warrior": "Integration Engineer",
+    "mage": "Recipe Builder",
+    "rogue": "API Hacker",
+    "cleric": "Support Engineer"
+}
+
+
+def _build_role_template(role: str) -> Dict[str, int]:
+    """Compute a role's starting stats, HP and MP from its class bonuses"""
+    bonuses = CLASS_BONUSES[role]
+
+    # Calculate stats
+    throughput = BASE_STATS["str"] + bonuses.get("str", 0)
+    formula_power = BASE_STATS["int"] + bonuses.get("int", 0)
+    rate_agility = BASE_STATS["dex"] + bonuses.get("dex", 0)
+    error_resilience = BASE_STATS["con"] + bonuses.get("con", 0)
+
+    # Calculate HP and MP
+    max_uptime = BASE_STATS["hp"] + bonuses["hp_mod"] + (error_resilience * 5)
+    max_api_credits = BASE_STATS["mp"] + bonuses["mp_mod"] + (formula_power * 3)
+
+    return {
+        "throughput": throughput,
+        "formula_power": formula_power,
+        "rate_agility": rate_agility,
+        "error_resilience": error_resilience,
+        "uptime": max_uptime,
+        "max_uptime": max_uptime,
+        "api_credits": max_api_credits,
+        "max_api_credits": max_api_credits,
+    }
+
+
+# Starting stats per role; only depend on class bonuses, so compute them once
+_ROLE_TEMPLATE = {role: _build_role_template(role) for role in CLASS_BONUSES}
+
+
+def _write_save_atomic(save_file: Path, payload: bytes) -> None:
+    """Write a save file via a temp file so readers never see a partial save"""
+    tmp_file = save_file.with_suffix(".tmp")
+    tmp_file.write_bytes(payload)
+    os.replace(tmp_file, save_file)
+
+
+def _queue_save(save_file: Path, payload: bytes) -> None:
+    """Hand a save off to the background writer"""
+    with _PENDING_SAVES_LOCK:
+        future = _SAVE_EXECUTOR.submit(_write_save_atomic, save_file, payload)
+        _PENDING_SAVES[save_file] = future
+
+    def _done(finished: Future) -> None:
+        # Only forget the write if a newer one hasn't replaced it
+        with _PENDING_SAVES_LOCK:
+            if _PENDING_SAVES.get(save_file) is finished:
+                del _PENDING_SAVES[save_file]
+
+    # Outside the lock: runs _done right away if the write already finished
+    future.add_done_callback(_done)
+
+
+def _wait_for_save(save_file: Path) -> None:
+    """Block until any queued write of save_file has finished"""
+    with _PENDING_SAVES_LOCK:
+        pending = _PENDING_SAVES.get(save_file)
+    if pending is not None:
+        pending.result()
+
+
+def _save_exists(save_file: Path) -> bool:
+    """Check if a save file is on disk or about to be"""
+    with _PENDING_SAVES_LOCK:
+        if save_file in _PENDING_SAVES:
+            return True
+    return save_file.exists()
+
+
+class FileSaveStore:
+    """Save files in a directory, written by the background writer"""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+
+    def _path(self, save_id: str) -> Path:
+        return self.directory / f"{save_id}.json"
+
+    def dump(self, game_state: GameState) -> bytes:
+        """Serialize a checkpoint of game_state, without its save_id"""
+        # Fields still at their defaults are left out; validation fills them back in on load
+        return game_state.model_dump_json(
+            indent=2 if PRETTY_SAVES else None, exclude={"save_id"}, exclude_defaults=True
+        ).encode()
+
+    def put(self, save_id: str, payload: bytes) -> None:
+        """Store a dumped checkpoint under save_id"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        _queue_save(self._path(save_id), payload)
+
+    def exists(self, save_id: str) -> bool:
+        """Check if a save is stored or about to be"""
+        return _save_exists(self._path(save_id))
+
+    def get(self, save_id: str) -> Optional[GameState]:
+        """Restore the game state saved under save_id, or None if there is none"""
+        save_file = self._path(save_id)
+        _wait_for_save(save_file)
+
+        if not save_file.exists():
+            return None
+
+        # Save files are untrusted input - always run full validation here,
+        # parsing the JSON in the same pass
+        game_state = GameState.model_validate_json(save_file.read_bytes())
+        game_state.save_id = save_id
+        return game_state
+
+
+class InMemorySaveStore:
+    """Saves kept in process memory, for tests that don't need them on disk"""
+
+    def __init__(self):
+        self._saves: Dict[str, bytes] = {}
+
+    def dump(self, game_state: GameState) -> bytes:
+        """Snapshot game_state, without its save_id"""
+        # Snapshots never leave the process, so pickle instead of a JSON round trip.
+        # Pickle the plain field values: pickling the model itself isn't byte-stable
+        # (its fields-set order varies), and save_game compares snapshot hashes
+        return pickle.dumps(game_state.model_dump(exclude={"save_id"}), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def put(self, save_id: str, payload: bytes) -> None:
+        """Store a dumped snapshot under save_id"""
+        self._saves[save_id] = payload
+
+    def exists(self, save_id: str) -> bool:
+        """Check if a save is stored"""
+        return save_id in self._saves
+
+    def get(self, save_id: str) -> Optional[GameState]:
+        """Restore the game state saved under save_id, or None if there is none"""
+        snapshot = self._saves.get(save_id)
+        if snapshot is None:
+            return None
+        game_state = GameState.model_validate(pickle.loads(snapshot))
+        game_state.save_id = save_id
+        return game_state
+
+
+# Where save_game / load_game keep checkpoints
+_save_store = FileSaveStore(_SAVES_DIR)
+
+
+def _save_prefix(session_id: str) -> str:
+    """Start of every save id written by a session (session ids aren't filename-safe, so hash them)"""
+    return f"save_{hashlib.blake2b(session_id.encode(), digest_size=6).hexdigest()}_"
+
+
+def _owns_save(session_id: str, save_id: str) -> bool:
+    """Check that save_id was written by session_id"""
+    if save_id.startswith(_save_prefix(session_id)):
+        return True
+    # Saves from before per-session ids (save_YYYYMMDD_HHMMSS) belong to the default session
+    return session_id == DEFAULT_SESSION and save_id.count("_") == 2
+
+
+def _store_game_state(session_id: str, game_state: GameState) -> None:
+    """Make game_state the active game for a session"""
+    game_states[session_id] = game_state
+
+
+def load_latest_save() -> Optional[GameState]:
+    """Load the most recent save file automatically"""
+    if not _SAVES_DIR.exists():
+        return None
+
+    # Only the default session's saves; within a session, save ids end in a
+    # timestamp, so the newest sorts last by name (no need to stat every file).
+    # Saves from before per-session ids are older than any prefixed one
+    latest_save = (
+        max(_SAVES_DIR.glob(f"{_save_prefix(DEFAULT_SESSION)}*.json"), default=None)
+        or max(_SAVES_DIR.glob("save_????????_??????.json"), default=None)
+    )
+
+    if latest_save is None:
+        return None
+
+    try:
+        # Restore game state
+        game_state = GameState.model_validate_json(latest_save.read_bytes())
+        game_state.save_id = latest_save.stem
+        _store_game_state(DEFAULT_SESSION, game_state)
+        return game_state
+
+    except Exception:
+        return None
+
+
+# Auto-load the latest save file on module initialization
+load_latest_save()
+
+
+def get_or_create_game_state(session_id: str = DEFAULT_SESSION) -> Optional[GameState]:
+    """Get game state for session, or None if not initialized"""
+    return game_states.get(session_id)
+
+
+def requires_game(fn: Callable[..., dict]) -> Callable[..., dict]:
+    """
+    Decorate a tool that needs an active game.
+
+    The wrapped tool receives the session's GameState as its first argument;
+    callers (and the MCP schema) only see the remaining parameters plus an
+    optional session_id, which is passed on if the tool declares it. Returns
+    the no_game error if no character has been created yet.
+    """
+    signature = inspect.signature(fn)
+    params = list(signature.parameters.values())[1:]
+    wants_session = "session_id" in signature.parameters
+    if not wants_session:
+        params.append(inspect.Parameter(
+            "session_id", inspect.Parameter.KEYWORD_ONLY, default=DEFAULT_SESSION, annotation=str
+        ))
+
+    @functools.wraps(fn)
+    def wrapper(*args, session_id: str = DEFAULT_SESSION, **kwargs) -> dict:
+        game_state = get_or_create_game_state(session_id)
+        if not game_state:
+            return {"error": ERRORS["no_game"]}
+        if wants_session:
+            kwargs["session_id"] = session_id
+        return fn(game_state, *args, **kwargs)
+
+    wrapper.__signature__ = signature.replace(parameters=params)
+    wrapper.__annotations__ = {
+        name: hint for name, hint in fn.__annotations__.items() if name != "game_state"
+    }
+    wrapper.__annotations__.setdefault("session_id", str)
+    return wrapper
+
+
+def create_new_game_state(name: str, role: str, session_id: str = DEFAULT_SESSION) -> GameState:
+    """Create a new game state"""
+
+    # Create hero with class bonuses. Everything here is built from trusted
+    # game data, so skip pydantic validation with model_construct. Untrusted
+    # input (save files) is validated in load_game instead.
+    hero = Hero.model_construct(
+        **_ROLE_TEMPLATE[role],
+        name=name,
+        role=role,
+        level=1,
+        xp=0,
+        equipped=EquipmentSlots.model_construct(weapon=_STARTING_WEAPON, armor=_STARTING_ARMOR),
+        skills=list(_ROLE_SKILLS[role]),
+        gold=0
+    )
+
+    # Add starting potions
+    hero.add_to_inventory(_STARTER_POTION, quantity=2)
+
+    # Create starting room
+    starting_room = dungeon_gen.create_starting_room()
+
+    # Generate first level
+    first_level = dungeon_gen.generate_dungeon_level(depth=1, room_count=4)
+
+    # Connect starting room to first generated room
+    first_room_id = next(iter(first_level))
+    starting_room.exits["north"] = first_room_id
+
+    # Create dungeon map
+    dungeon_map = {starting_room.id: starting_room}
+    dungeon_map.update(first_level)
+
+    # Create game state
+    game_state = GameState.model_construct(
+        hero=hero,
+        current_room_id=starting_room.id,
+        dungeon_map=dungeon_map,
+        depth=1
+    )
+
+    _store_game_state(session_id, game_state)
+    return game_state
+
+
+# ============================================================================
+# NARRATIVE FORMATTING
+# ============================================================================
+
+# Narrative templates, filled with str.format_map
+_CREATION_TEMPLATE = """📜 **{name} the {role_name}** awakens in the Integration Dungeon...
+
+You clutch your {weapon_name}—a humble starting connector, but it will grow.
+Somewhere deep below, legacy systems await connection. The air smells of stale JSON and
+broken promises.
+
+🎭 **Role**: {role_name} ({role_title})
+📊 **Stats**:
+   - Uptime: {uptime}/{max_uptime}
+   - API Credits: {api_credits}/{max_api_credits}
+   - Throughput (STR): {throughput}
+   - Formula Power (INT): {formula_power}
+   - Rate Agility (DEX): {rate_agility}
+   - Error Resilience (CON): {error_resilience}
+
+⚔️ **Equipped**: {weapon_name} ({weapon_dice}) | {armor_name} (+{armor_protection})
+🎒 **Inventory**: Job Retry Potion x2
+
+💡 Use 'explore' to examine your surroundings, or 'view_status' to see your full character sheet.
+"""
+
+_STATUS_TEMPLATE = """📊 **{name} the {role_title}** - Level {level}
+
+❤️ **Uptime**: {uptime}/{max_uptime}
+💙 **API Credits**: {api_credits}/{max_api_credits}
+⭐ **XP**: {xp}/{xp_next} to next level
+💰 **Gold**: {gold}
+
+📈 **Stats**:
+   - Throughput (STR): {throughput}
+   - Formula Power (INT): {formula_power}
+   - Rate Agility (DEX): {rate_agility}
+   - Error Resilience (CON): {error_resilience}
+   - Armor: {armor_value}
+
+⚔️ **Equipment**:
+   - Weapon: {weapon_name} ({weapon_dice})
+   - Armor: {armor_name} (+{armor_protection})
+
+🎒 **Inventory** ({inventory_count}/20):
+   - {inventory}
+
+⚡ **Skills**:
+   - {skills}
+
+✨ **Status Effects**: {status_effects}
+🧩 **Recipe Fragments**: {recipe_fragments} (collect 3 for +5 max Uptime)
+
+📍 **Location**: Depth {depth} - {location}
+{combat_line}
+"""
+
+
+def _format_status(game_state: GameState) -> str:
+    """Build the character sheet narrative"""
+    hero = game_state.hero
+
+    # Format inventory
+    inventory_str = "\n   - ".join(
+        f"{inv_item.item.name} {f'x{inv_item.quantity}' if inv_item.quantity > 1 else ''}"
+        for inv_item in hero.inventory
+    ) or "Empty"
+
+    # Format skills
+    skills_str = "\n   - ".join(
+        f"{skill['name']} ({skill['cost']} credits): {skill['description']}"
+        for skill in (_SKILLS_BY_ID.get(skill_id) for skill_id in hero.skills)
+        if skill
+    ) or "Basic Attack only"
+
+    weapon = hero.equipped.weapon
+    armor = hero.equipped.armor
+
+    return _STATUS_TEMPLATE.format_map({
+        "name": hero.name,
+        "role_title": hero.role.title(),
+        "level": hero.level,
+        "uptime": hero.uptime,
+        "max_uptime": hero.max_uptime,
+        "api_credits": hero.api_credits,
+        "max_api_credits": hero.max_api_credits,
+        "xp": hero.xp,
+        "xp_next": ProgressionSystem.xp_required_for_level(hero.level + 1),
+        "gold": hero.gold,
+        "throughput": hero.throughput,
+        "formula_power": hero.formula_power,
+        "rate_agility": hero.rate_agility,
+        "error_resilience": hero.error_resilience,
+        "armor_value": hero.get_armor_value(),
+        "weapon_name": weapon.name if weapon else "None",
+        "weapon_dice": weapon.damage_dice if weapon else "N/A",
+        "armor_name": armor.name if armor else "None",
+        "armor_protection": armor.protection if armor else 0,
+        "inventory_count": len(hero.inventory),
+        "inventory": inventory_str,
+        "skills": skills_str,
+        "status_effects": StatusEffectManager.format_effects_list(hero),
+        "recipe_fragments": hero.recipe_fragments,
+        "depth": game_state.depth,
+        "location": game_state.get_current_room().system_name,
+        "combat_line": "⚔️ **IN COMBAT**" if game_state.is_in_combat() else "",
+    })
+
+
+def _format_room(room: Room) -> str:
+    """Build the room description narrative"""
+    # Format exits
+    exits_str = ", ".join(direction.upper() for direction in room.exits)
+
+    # Format items (consumables don't have tier)
+    items_str = ", ".join(
+        f"{item.name} ({getattr(item, 'tier', 'consumable')})" for item in room.items
+    ) or "None"
+
+    # Format enemies
+    enemies_str = "\n   - ".join(
+        f"{enemy.emoji} **{enemy.name}** ({enemy.hp}/{enemy.max_hp} HP)" for enemy in room.iter_alive()
+    )
+    has_enemies = bool(enemies_str)
+    enemies_str = enemies_str or "None"
+
+    return f"""🏛️ **{room.system_name.upper()}**
+
+{room.description}
+
+📍 **Exits**: [{exits_str}]
+📦 **Items**: {items_str}
+👹 **Enemies**:
+   - {enemies_str}
+
+{"⚠️ Enemies block your path! You must fight or flee." if has_enemies and not room.is_cleared else "✅ Room cleared. You may explore freely."}
+"""
+
+
+def _format_enemy(enemy: Enemy) -> str:
+    """Build the narrative for an examined enemy"""
+    weakness_str = f"**Weakness**: {enemy.weakness}" if enemy.weakness else "No known weakness"
+    resistance_str = f"**Resistance**: {enemy.resistance}" if enemy.resistance else ""
+    special_str = f"**Special**: {enemy.special_ability}" if enemy.special_ability else ""
+
+    return f"""🔍 **{enemy.name.upper()}**
+
+{enemy.description}
+
+**HP**: {enemy.hp}/{enemy.max_hp}
+**Damage**: {enemy.damage_dice}
+**Armor**: {enemy.armor}
+{weakness_str}
+{resistance_str}
+{special_str}
+
+**XP Reward**: {enemy.xp_reward}
+**Gold Reward**: {enemy.gold_reward}
+
+{"💡 This enemy was IMMUNE until examined! You can now damage it." if enemy.immune_until_examined else ""}
+"""
+
+
+def _format_item(item: LootItem) -> str:
+    """Build the narrative for an examined item"""
+    return f"""🔍 **{item.name}**
+
+{item.description}
+
+**Tier**: {getattr(item, 'tier', 'consumable')}
+**Type**: {item.item_type if hasattr(item, 'item_type') else type(item).__name__}
+
+Use 'pickup' to add this to your inventory.
+"""
+
+
+# ============================================================================
+# CONSUMABLE EFFECTS
+# ============================================================================
+
+def _effect_heal_hp(game_state: GameState, consumable: Consumable, messages: list) -> None:
+    """Restore Uptime"""
+    hero = game_state.hero
+    heal_amount = min(consumable.effect_value, hero.max_uptime - hero.uptime)
+    hero.uptime += heal_amount
+    messages.append(f"❤️ Restored {heal_amount} Uptime! ({hero.uptime}/{hero.max_uptime})")
+
+
+def _effect_heal_mp(game_state: GameState, consumable: Consumable, messages: list) -> None:
+    """Restore API Credits"""
+    hero = game_state.hero
+    restore_amount = min(consumable.effect_value, hero.max_api_credits - hero.api_credits)
+    hero.api_credits += restore_amount
+    messages.append(f"💙 Restored {restore_amount} API Credits! ({hero.api_credits}/{hero.max_api_credits})")
+
+
+def _effect_cure_status(game_state: GameState, consumable: Consumable, messages: list) -> None:
+    """Remove the status effect named by the item"""
+    StatusEffectManager.remove_effect(game_state.hero, consumable.effect_value)
+    messages.append(f"✨ {consumable.effect_value.replace('_', ' ').title()} cured!")
+
+
+def _effect_escape(game_state: GameState, consumable: Consumable, messages: list) -> None:
+    """End the current combat"""
+    if game_state.is_in_combat():
+        game_state.combat.active = False
+        messages.append("💨 Graceful degradation successful! You've escaped combat!")
+
+
+def _effect_special(game_state: GameState, consumable: Consumable, messages: list) -> None:
+    """Item-specific effects (recipe fragments)"""
+    if consumable.effect_value == "fragment":
+        bonus_applied, fragment_msg = ProgressionSystem.add_recipe_fragment(game_state.hero)
+        messages.append(fragment_msg)
+
+
+# Consumable effect type -> handler; types without an entry have no effect yet
+_EFFECT_HANDLERS: Dict[str, Callable[[GameState, Consumable, list], None]] = {
+    ConsumableEffect.HEAL_HP: _effect_heal_hp,
+    ConsumableEffect.HEAL_MP: _effect_heal_mp,
+    ConsumableEffect.CURE_STATUS: _effect_cure_status,
+    ConsumableEffect.ESCAPE: _effect_escape,
+    ConsumableEffect.SPECIAL: _effect_special,
+}
+
+# Equippable item kind (see item_tag) -> (equipment slot, equip message template)
+_EQUIP_SLOTS: Dict[str, Tuple[str, str]] = {
+    "weapon": ("weapon", "⚔️ Equipped **{item.name}** ({item.damage_dice})!"),
+    "armor": ("armor", "🛡️ Equipped **{item.name}** (+{item.protection} protection)!"),
+}
+
+
+# ============================================================================
+# MCP TOOLS (15 Total)
+# ============================================================================
+
+def create_character(
+    name: str,
+    role: Literal["warrior", "mage", "rogue", "cleric"],
+    session_id: str = DEFAULT_SESSION
+) -> dict:
+    """
+    Create an Integration Hero and begin your quest.
+
+    Roles:
+    - warrior (Integration Engineer): High Throughput, bulk operations
+    - mage (Recipe Builder): Formula Power, transformations
+    - rogue (API Hacker): Rate Agility, workarounds
+    - cleric (Support Engineer): Error Resilience, recovery
+
+    Args:
+        name: Your hero's name
+        role: Character class/role
+        session_id: Game session to start the quest in
+
+    Returns:
+        Hero creation confirmation and starting stats
+    """
+
+    # Create new game state
+    game_state = create_new_game_state(name, role, session_id)
+    hero = game_state.hero
+
+    weapon = hero.equipped.weapon
+    armor = hero.equipped.armor
+    role_name = _ROLE_NAMES[role]
+
+    narrative = _CREATION_TEMPLATE.format_map({
+        "name": name,
+        "role_name": role_name,
+        "role_title": role.title(),
+        "weapon_name": weapon.name,
+        "weapon_dice": weapon.damage_dice,
+        "armor_name": armor.name,
+        "armor_protection": armor.protection,
+        "uptime": hero.uptime,
+        "max_uptime": hero.max_uptime,
+        "api_credits": hero.api_credits,
+        "max_api_credits": hero.max_api_credits,
+        "throughput": hero.throughput,
+        "formula_power": hero.formula_power,
+        "rate_agility": hero.rate_agility,
+        "error_resilience": hero.error_resilience,
+    })
+
+    return {
+        "narrative": narrative,
+        "state": {
+            "hero_name": hero.name,
+            "role": hero.role,
+            "level": hero.level,
+            "uptime": f"{hero.uptime}/{hero.max_uptime}",
+            "api_credits": f"{hero.api_credits}/{hero.max_api_credits}"
+        }
+    }
+
+
+@requires_game
+def view_status(game_state: GameState, verbose: bool = True) -> dict:
+    """
+    View your Integration Hero's current Uptime, API Credits, stats, inventory, and status effects.
+
+    Args:
+        verbose: Include the full character sheet narrative (False returns only state)
+
+    Returns:
+        Complete character status sheet
+    """
+
+    hero = game_state.hero
+    state = {
+        "level": hero.level,
+        "uptime": hero.uptime,
+        "max_uptime": hero.max_uptime,
+        "api_credits": hero.api_credits,
+        "in_combat": game_state.is_in_combat()
+    }
+
+    if not verbose:
+        return {"state": state}
+
+    return {"narrative": _format_status(game_state), "state": state}
+
+
+@requires_game
+def explore(game_state: GameState, verbose: bool = True) -> dict:
+    """
+    Explore the current system. Reveals room details, items, connectors, and integration villains.
+
+    Args:
+        verbose: Include the room description narrative (False returns only state)
+
+    Returns:
+        Current room description with contents and exits
+    """
+
+    room = game_state.get_current_room()
+    room.is_discovered = True
+
+    state = {
+        "room_type": room.room_type,
+        "has_enemies": room.any_alive(),
+        "has_items": len(room.items) > 0,
+        "exits": list(room.exits.keys())
+    }
+
+    if not verbose:
+        return {"state": state}
+
+    return {"narrative": _format_room(room), "state": state}
+
+
+@requires_game
+def examine(game_state: GameState, target: str, verbose: bool = True) -> dict:
+    """
+    Examine an enemy, item, or system feature in detail.
+    Critical for Undocumented API enemies—they're immune until examined!
+
+    Args:
+        target: Name of enemy or item to examine
+        verbose: Include the detail narrative (False returns only state)
+
+    Returns:
+        Detailed information about the target
+    """
+
+    room = game_state.get_current_room()
+
+    # Check if examining an enemy
+    enemy = room.find_enemy(target)
+    if enemy:
+        enemy.is_examined = True
+
+        state = {
+            "examined": target,
+            "enemy_hp": enemy.hp,
+            "enemy_max_hp": enemy.max_hp
+        }
+
+        if not verbose:
+            return {"state": state}
+
+        return {"narrative": _format_enemy(enemy), "state": state}
+
+    # Check if examining an item
+    item = room.find_item(target)
+    if item:
+        if not verbose:
+            return {"state": {"examined": target}}
+
+        return {"narrative": _format_item(item)}
+
+    return {"error": ERRORS["invalid_target"].format(target=target)}
+
+
+@requires_game
+def move(
+    game_state: GameState,
+    direction: Literal["north", "south", "east", "west"],
+    session_id: str = DEFAULT_SESSION
+) -> dict:
+    """
+    Navigate to an adjacent system.
+
+    Args:
+        direction: Cardinal direction to move
+        session_id: Game session to move in
+
+    Returns:
+        New room description or failure message
+    """
+
+    room = game_state.get_current_room()
+
+    # Check if in combat
+    if game_state.is_in_combat():
+        return {"error": "⚔️ You cannot move while in combat! Use 'flee' to escape."}
+
+    # Check if direction exists
+    if direction not in room.exits:
+        return {"error": ERRORS["invalid_direction"].format(direction=direction)}
+
+    # Check if enemies block the path
+    if room.any_alive() and not room.is_cleared:
+        return {"error": "⚠️ Enemies block your path! Defeat them first or use 'flee' to escape."}
+
+    # Move to new room
+    next_room_id = room.exits[direction]
+
+    # Generate new room if needed
+    if next_room_id == "generated" or next_room_id not in game_state.dungeon_map:
+        new_depth = game_state.depth + 1
+        new_rooms = dungeon_gen.generate_dungeon_level(new_depth, room_count=4)
+        game_state.dungeon_map.update(new_rooms)
+        next_room_id = list(new_rooms.keys())[0]
+        room.exits[direction] = next_room_id
+        game_state.depth = new_depth
+
+        if new_depth > game_state.max_depth_reached:
+            game_state.max_depth_reached = new_depth
+
+    game_state.current_room_id = next_room_id
+    game_state.turn_count += 1
+    game_state.update_timestamp()
+
+    # Explore the new room automatically
+    return explore(session_id=session_id)
+
+
+@requires_game
+def attack(game_state: GameState, target: str, skill: str = "basic_attack") -> dict:
+    """
+    Attack an integration villain.
+
+    Args:
+        target: Enemy name (e.g., "Rate Limit Guardian")
+        skill: Skill to use (default: basic_attack, or class skill name)
+
+    Returns:
+        Combat result with damage dealt and enemy status
+    """
+
+    hero = game_state.hero
+    room = game_state.get_current_room()
+
+    # Find enemy
+    enemy = room.find_enemy(target)
+
+    if not enemy:
+        return {"error": ERRORS["invalid_target"].format(target=target)}
+
+    # Initialize combat if not started
+    if not game_state.is_in_combat():
+        game_state.combat = CombatSystem.initialize_combat(hero, list(room.iter_alive()))
+
+    # Find skill
+    skill_info = _SKILLS_BY_ID.get(skill)
+    if not skill_info:
+        return {"error": f"❓ Skill '{skill}' not found!"}
+
+    # Check MP cost
+    mp_cost = int(skill_info["cost"] * StatusEffectManager.get_mp_cost_modifier(hero))
+    if hero.api_credits < mp_cost:
+        return {"error": ERRORS["insufficient_credits"]}
+
+    # Deduct MP
+    hero.api_credits -= mp_cost
+
+    # Execute attack
+    result = CombatSystem.hero_attack(
+        hero,
+        enemy,
+        game_state.combat,
+        skill_multiplier=skill_info.get("damage_multiplier", 1.0),
+        ignore_armor=skill_info.get("ignore_armor", False)
+    )
+
+    messages = result["messages"]
+    if result["enemy_defeated"]:
+        room.mark_enemy_defeated()
+
+    # Check if all enemies defeated
+    if room.all_enemies_defeated():
+        room.is_cleared = True
+        game_state.combat = None
+        messages.append("\n" + _choice(_VICTORY_MESSAGES))
+
+        # Add XP and gold
+        total_xp, total_gold = room.total_rewards()
+
+        leveled_up, level_messages = ProgressionSystem.add_experience(hero, total_xp)
+        ProgressionSystem.add_gold(hero, total_gold)
+
+        messages.extend(level_messages)
+
+    else:
+        # Enemy turn
+        for e in room.iter_alive():
+            enemy_result = CombatSystem.enemy_attack(e, hero, game_state.combat)
+            messages.extend(enemy_result["messages"])
+
+            if enemy_result["hero_defeated"]:
+                messages.append("\n" + _choice(_GAME_OVER_MESSAGES))
+                return {
+                    "narrative": "\n".join(messages),
+                    "combat_log": result,
+                    "state": {"game_over": True}
+                }
+
+    narrative = "\n".join(messages)
+
+    return {
+        "narrative": narrative,
+        "combat_log": result,
+        "state": {
+            "uptime": hero.uptime,
+            "api_credits": hero.api_credits,
+            "combat_active": game_state.is_in_combat(),
+            "room_cleared": room.is_cleared
+        }
+    }
+
+
+@requires_game
+def defend(game_state: GameState) -> dict:
+    """
+    Defensive stance. Reduces incoming damage by 50% and triggers retry logic if equipped.
+
+    Returns:
+        Defense confirmation and turn results
+    """
+
+    if not game_state.is_in_combat():
+        return {"error": ERRORS["not_in_combat"]}
+
+    hero = game_state.hero
+    game_state.combat.hero_defending = True
+
+    messages = ["🛡️ You take a defensive stance, bracing for incoming attacks!"]
+
+    # Enemy attacks with reduced damage
+    room = game_state.get_current_room()
+    for enemy in room.iter_alive():
+        enemy_result = CombatSystem.enemy_attack(enemy, hero, game_state.combat)
+        messages.extend(enemy_result["messages"])
+
+        if enemy_result["hero_defeated"]:
+            # Check for try/catch vest
+            if hero.equipped.armor and "try" in hero.equipped.armor.name.lower():
+                messages.append("💚 Try/Catch Vest activated! You survive with 1 Uptime!")
+                hero.uptime = 1
+            else:
+                messages.append("\n" + _choice(_GAME_OVER_MESSAGES))
+                return {
+                    "narrative": "\n".join(messages),
+                    "state": {"game_over": True}
+                }
+
+    # Reset defending for next turn
+    game_state.combat.hero_defending = False
+
+    return {
+        "narrative": "\n".join(messages),
+        "state": {
+            "uptime": hero.uptime,
+            "combat_active": True
+        }
+    }
+
+
+@requires_game
+def use_item(game_state: GameState, item: str, target: str = "self") -> dict:
+    """
+    Use a consumable from inventory.
+
+    Args:
+        item: Item name (e.g., "Job Retry Potion")
+        target: Target of item effect (default: self)
+
+    Returns:
+        Item usage result
+    """
+
+    hero = game_state.hero
+
+    # Find item in inventory
+    inv_item = hero.find_inventory(item, Consumable)
+    consumable = inv_item.item if inv_item else None
+
+    if not consumable:
+        return {"error": ERRORS["item_not_found"].format(item=item)}
+
+    messages = [f"🧪 You use {consumable.name}!"]
+
+    # Apply effect
+    handler = _EFFECT_HANDLERS.get(consumable.effect_type)
+    if handler:
+        handler(game_state, consumable, messages)
+
+    # Remove item from inventory
+    hero.remove_from_inventory(consumable.id, quantity=1)
+
+    return {
+        "narrative": "\n".join(messages),
+        "state": {
+            "uptime": hero.uptime,
+            "api_credits": hero.api_credits
+        }
+    }
+
+
+@requires_game
+def pickup(game_state: GameState, item: str) -> dict:
+    """
+    Pick up an item or connector from the current room.
+
+    Args:
+        item: Item name to pick up
+
+    Returns:
+        Pickup confirmation
+    """
+
+    hero = game_state.hero
+    room = game_state.get_current_room()
+
+    # Find item in room
+    found_item = room.find_item(item)
+
+    if not found_item:
+        return {"error": ERRORS["item_not_found"].format(item=item)}
+
+    # Add to inventory
+    success = hero.add_to_inventory(found_item, quantity=1)
+
+    if not success:
+        return {"error": ERRORS["inventory_full"]}
+
+    # Remove from room
+    room.items.remove(found_item)
+
+    return {
+        "narrative": f"✅ Picked up **{found_item.name}**! Added to inventory.",
+        "state": {
+            "inventory_count": len(hero.inventory)
+        }
+    }
+
+
+@requires_game
+def equip(game_state: GameState, item: str) -> dict:
+    """
+    Equip a connector (weapon), error handler (armor), or accessory from inventory.
+
+    Args:
+        item: Item name to equip
+
+    Returns:
+        Equipment confirmation
+    """
+
+    hero = game_state.hero
+
+    # Find item in inventory
+    inv_item = hero.find_inventory(item)
+    found_item = inv_item.item if inv_item else None
+
+    if not found_item:
+        return {"error": ERRORS["item_not_found"].format(item=item)}
+
+    # Equip into the slot for this item type
+    slot_info = _EQUIP_SLOTS.get(item_tag(found_item))
+    if slot_info is None:
+        return {"error": "❓ This item cannot be equipped."}
+
+    slot, template = slot_info
+    old_item = getattr(hero.equipped, slot)
+    setattr(hero.equipped, slot, found_item)
+    msg = template.format(item=found_item)
+    if old_item:
+        msg += f" (Unequipped {old_item.name})"
+
+    return {
+        "narrative": msg,
+        "state": {
+            "weapon": hero.equipped.weapon.name if hero.equipped.weapon else None,
+            "armor": hero.equipped.armor.name if hero.equipped.armor else None
+        }
+    }
+
+
+@requires_game
+def rest(game_state: GameState) -> dict:
+    """
+    Rest to recover Uptime and API Credits.
+    Warning: 20% chance of triggering a random encounter!
+
+    Returns:
+        Rest results and possible encounter
+    """
+
+    if game_state.is_in_combat():
+        return {"error": "⚔️ You cannot rest during combat!"}
+
+    hero = game_state.hero
+
+    # Calculate recovery
+    hp_recovered = int((hero.max_uptime - hero.uptime) * REST_HP_RECOVERY)
+    mp_recovered = int((hero.max_api_credits - hero.api_credits) * REST_MP_RECOVERY)
+
+    hero.uptime = min(hero.max_uptime, hero.uptime + hp_recovered)
+    hero.api_credits = min(hero.max_api_credits, hero.api_credits + mp_recovered)
+
+    messages = [
+        "😴 You rest and recover...",
+        f"❤️ Uptime restored: +{hp_recovered} ({hero.uptime}/{hero.max_uptime})",
+        f"💙 API Credits restored: +{mp_recovered} ({hero.api_credits}/{hero.max_api_credits})"
+    ]
+
+    # Random encounter chance
+    if _roll_chance() < REST_ENCOUNTER_CHANCE:
+        messages.append("\n⚠️ **AMBUSH!** A random encounter interrupts your rest!")
+
+        # Generate random enemy
+        room = game_state.get_current_room()
+        new_enemy = dungeon_gen._generate_enemies(game_state.depth, "corridor")
+        room.add_enemies(new_enemy)
+        room.is_cleared = False
+
+        messages.append(f"👹 {new_enemy[0].name} appears!")
+
+    return {
+        "narrative": "\n".join(messages),
+        "state": {
+            "uptime": hero.uptime,
+            "api_credits": hero.api_credits
+        }
+    }
+
+
+@requires_game
+def flee(game_state: GameState) -> dict:
+    """
+    Attempt graceful degradation (escape combat). Success based on Rate Agility.
+
+    Returns:
+        Flee attempt result
+    """
+
+    if not game_state.is_in_combat():
+        return {"error": ERRORS["not_in_combat"]}
+
+    hero = game_state.hero
+
+    # Calculate flee chance
+    flee_chance = FLEE_BASE_CHANCE + (hero.rate_agility * 0.02)  # +2% per DEX point
+    success = _roll_chance() < flee_chance
+
+    if success:
+        game_state.combat.active = False
+        return {
+            "narrative": "💨 Graceful degradation successful! You've escaped combat!",
+            "state": {"combat_active": False}
+        }
+    else:
+        messages = ["❌ Escape failed! The enemies block your retreat!"]
+
+        # Enemies get free attacks
+        room = game_state.get_current_room()
+        for enemy in room.iter_alive():
+            enemy_result = CombatSystem.enemy_attack(enemy, hero, game_state.combat)
+            messages.extend(enemy_result["messages"])
+
+            if enemy_result["hero_defeated"]:
+                messages.append("\n" + _choice(_GAME_OVER_MESSAGES))
+                return {
+                    "narrative": "\n".join(messages),
+                    "state": {"game_over": True}
+                }
+
+        return {
+            "narrative": "\n".join(messages),
+            "state": {
+                "uptime": hero.uptime,
+                "combat_active": True
+            }
+        }
+
+
+@requires_game
+def save_game(game_state: GameState, session_id: str = DEFAULT_SESSION) -> dict:
+    """
+    Create a checkpoint. Returns save ID for later restoration.
+
+    Args:
+        session_id: Game session to save
+
+    Returns:
+        Save confirmation with save ID
+    """
+
+    # Serialize once: the same payload is hashed and written. Skip the write
+    # entirely if nothing changed since the last save
+    payload = _save_store.dump(game_state)
+    state_hash = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    last_save = _LAST_SAVE.get(session_id)
+    if (last_save and last_save[0] == state_hash and _owns_save(session_id, last_save[1])
+            and _save_store.exists(last_save[1])):
+        save_id = last_save[1]
+    else:
+        # Generate save ID: unique per session and per save, and sorts by time within a session
+        save_id = f"{_save_prefix(session_id)}{_now().strftime('%Y%m%d_%H%M%S_%f')}"
+
+        _save_store.put(save_id, payload)
+        _LAST_SAVE[session_id] = (state_hash, save_id)
+    game_state.save_id = save_id
+
+    return {
+        "narrative": f"💾 Game saved!\n\n**Save ID**: {save_id}\n\nUse this ID with 'load_game' to restore your progress.",
+        "state": {"save_id": save_id}
+    }
+
+
+def load_game(save_id: str, session_id: str = DEFAULT_SESSION) -> dict:
+    """
+    Restore from a previous checkpoint.
+
+    Args:
+        save_id: Save ID from previous save_game call
+        session_id: Game session to restore into
+
+    Returns:
+        Load confirmation
+    """
+
+    # Another session's saves are reported as missing, not restored here
+    game_state = _save_store.get(save_id) if _owns_save(session_id, save_id) else None
+    if game_state is None:
+        return {"error": f"❌ Save file '{save_id}' not found!"}
+
+    _store_game_state(session_id, game_state)
+
+    hero = game_state.hero
+
+    return {
+        "narrative": f"📂 Game loaded!\n\nWelcome back, **{hero.name}**!\n\nLevel {hero.level} {hero.role.title()}\nDepth: {game_state.depth}\nUptime: {hero.uptime}/{hero.max_uptime}",
+        "state": {
+            "hero_name": hero.name,
+            "level": hero.level,
+            "depth": game_state.depth
+        }
+    }
+
+
+@requires_game
+def enter_diagnostic_code(game_state: GameState, code: str) -> dict:
+    """
+    Run system diagnostics with a diagnostic code.
+
+    Args:
+        code: Diagnostic code sequence
+
+    Returns:
+        Diagnostic result
+    """
+
+    hero = game_state.hero
+
+    # Verify diagnostic checksum
+    code_hash = hashlib.md5(code.encode()).hexdigest()
+    if code_hash == "c79c28c71f0363cc52f32fb29e130222":
+        # Toggle god mode
+        if hero.god_mode_active:
+            # DISABLE GOD MODE - Restore original stats
+            if hero.saved_stats:
+                hero.throughput = hero.saved_stats["throughput"]
+                hero.formula_power = hero.saved_stats["formula_power"]
+                hero.rate_agility = hero.saved_stats["rate_agility"]
+                hero.error_resilience = hero.saved_stats["error_resilience"]
+                hero.max_uptime = hero.saved_stats["max_uptime"]
+                hero.uptime = hero.saved_stats["uptime"]
+                hero.max_api_credits = hero.saved_stats["max_api_credits"]
+                hero.api_credits = hero.saved_stats["api_credits"]
+                hero.gold = hero.saved_stats["gold"]
+                hero.level = hero.saved_stats["level"]
+                hero.xp = hero.saved_stats["xp"]
+
+                # Remove god mode status effect
+                hero.remove_status_effect("God Mode")
+
+                # Clear saved stats and flag
+                hero.saved_stats = None
+                hero.god_mode_active = False
+
+                narrative = f"""🌙 **RETURNING TO MORTAL FORM** 🌙
+
+The legendary power fades as {hero.name} returns to their natural state...
+
+**GOD MODE DISABLED**
+
+📊 **RESTORED STATS**:
+   - Throughput: {hero.throughput}
+   - Formula Power: {hero.formula_power}
+   - Rate Agility: {hero.rate_agility}
+   - Error Resilience: {hero.error_resilience}
+
+❤️ **Uptime**: {hero.uptime}/{hero.max_uptime}
+💙 **API Credits**: {hero.api_credits}/{hero.max_api_credits}
+⭐ **Level**: {hero.level}
+💰 **Gold**: {hero.gold}
+
+✨ **Status**: Normal (God Mode effect removed)
+
+You are once again bound by mortal limitations. But you are wiser for the experience.
+"""
+
+                return {
+                    "narrative": narrative,
+                    "state": {
+                        "god_mode": False,
+                        "level": hero.level,
+                        "uptime": hero.uptime,
+                        "max_uptime": hero.max_uptime,
+                        "api_credits": hero.api_credits,
+                        "max_api_credits": hero.max_api_credits
+                    }
+                }
+            else:
+                # No saved stats to restore (shouldn't happen, but handle gracefully)
+                hero.god_mode_active = False
+                return {
+                    "narrative": "⚠️ God mode disabled, but no saved stats found to restore.",
+                    "state": {"god_mode": False}
+                }
+        else:
+            # ENABLE GOD MODE - Save current stats first
+            hero.saved_stats = {
+                "throughput": hero.throughput,
+                "formula_power": hero.formula_power,
+                "rate_agility": hero.rate_agility,
+                "error_resilience": hero.error_resilience,
+                "max_uptime": hero.max_uptime,
+                "uptime": hero.uptime,
+                "max_api_credits": hero.max_api_credits,
+                "api_credits": hero.api_credits,
+                "gold": hero.gold,
+                "level": hero.level,
+                "xp": hero.xp
+            }
+
+            # Apply system calibration overrides
+            hero.throughput = 999
+            hero.formula_power = 999
+            hero.rate_agility = 999
+            hero.error_resilience = 999
+
+            # Reset resource pools to test values
+            hero.max_uptime = 9999
+            hero.uptime = 9999
+            hero.max_api_credits = 9999
+            hero.api_credits = 9999
+
+            # Initialize test economy values
+            hero.gold = 999999
+            hero.level = 99
+            hero.xp = 999999
+
+            # Apply persistent test flag
+            test_flag = StatusEffect(
+                name="God Mode",
+                effect_type="transformed",
+                duration=-1,
+                description="Ascended beyond mortal limitations",
+                stat_modifier={"all": 999}
+            )
+
+            # Clear existing flags and set new test state
+            hero.remove_status_effect("God Mode")
+            hero.add_status_effect(test_flag)
+
+            # Set god mode flag
+            hero.god_mode_active = True
+
+            narrative = f"""⚡ **LEGENDARY POWER ACTIVATED** ⚡
+
+🌟 The ancient Integration Architect's blessing flows through {hero.name}!
+✨ You feel the power of infinite connections coursing through your circuits!
+
+**GOD MODE ENABLED**
+
+📊 **ASCENDED STATS**:
+   - Throughput: {hero.throughput} (MAXIMUM)
+   - Formula Power: {hero.formula_power} (MAXIMUM)
+   - Rate Agility: {hero.rate_agility} (MAXIMUM)
+   - Error Resilience: {hero.error_resilience} (MAXIMUM)
+
+❤️ **Uptime**: {hero.uptime}/{hero.max_uptime}
+💙 **API Credits**: {hero.api_credits}/{hero.max_api_credits}
+⭐ **Level**: {hero.level}
+💰 **Gold**: {hero.gold}
+
+🔱 **Status**: GOD MODE (Active - use code again to disable)
+
+You are now unstoppable. The dungeon trembles at your presence!
+"""
+
+            return {
+                "narrative": narrative,
+                "state": {
+                    "god_mode": True,
+                    "level": hero.level,
+                    "uptime": hero.uptime,
+                    "max_uptime": hero.max_uptime,
+                    "api_credits": hero.api_credits,
+                    "max_api_credits": hero.max_api_credits
+                }
+            }
+
+    return {
+        "narrative": f"🔧 Diagnostic code '{code}' not recognized. System nominal.",
+        "state": {"diagnostic_complete": True}
+    }
+
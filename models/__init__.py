@@ -4,21 +4,26 @@ Integration Quest Game Models
 Pydantic models for hero, enemies, rooms, combat, and items.
 """
 
-from .hero import Hero, EquipmentSlots, StatusEffect
-from .combat import CombatState, Enemy
-from .world import Room, GameState
-from .items import Item, Weapon, Armor, Consumable
+from .hero import Hero, EquipmentSlots, StatusEffect, StatusEffectType
+from .combat import CombatState, Enemy, EnemyTier
+from .world import Room, RoomType, GameState
+from .items import Item, Weapon, Armor, Consumable, Tier, ConsumableEffect
 
 __all__ = [
     "Hero",
     "EquipmentSlots",
     "StatusEffect",
+    "StatusEffectType",
     "CombatState",
     "Enemy",
+    "EnemyTier",
     "Room",
+    "RoomType",
     "GameState",
     "Item",
     "Weapon",
     "Armor",
     "Consumable",
+    "Tier",
+    "ConsumableEffect",
 ]
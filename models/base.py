@@ -0,0 +1,16 @@
+"""
+Shared pydantic base model for game data.
+"""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class GameModel(BaseModel):
+    """Base for all game models"""
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        arbitrary_types_allowed=False,
+        # Build validators on first use so unused models cost nothing at import
+        defer_build=True,
+    )
@@ -2,11 +2,21 @@
 Combat and enemy models.
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Literal
+from enum import StrEnum
+from pydantic import Field, PrivateAttr
+from typing import Any, List, Optional
+from .base import GameModel
 
 
-class Enemy(BaseModel):
+class EnemyTier(StrEnum):
+    """Enemy difficulty tier"""
+    COMMON = "common"
+    UNCOMMON = "uncommon"
+    RARE = "rare"
+    BOSS = "boss"
+
+
+class Enemy(GameModel):
     """Integration villain enemy"""
     id: str
     name: str
@@ -31,14 +41,25 @@ class Enemy(BaseModel):
     loot_table: str  # Tier name for loot generation
 
     # Enemy tier
-    tier: Literal["common", "uncommon", "rare", "boss"]
+    tier: EnemyTier
 
     # Runtime state
     is_examined: bool = False
     status_effects: List[str] = Field(default_factory=list)
 
+    # Lowercased name for target matching (not serialized)
+    _name_lower: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context: Any) -> None:
+        """Cache the lowercased name"""
+        self._name_lower = self.name.lower()
+
+    def matches(self, query: str) -> bool:
+        """Check if an already-lowercased target string refers to this enemy"""
+        return query in self._name_lower
 
-class CombatState(BaseModel):
+
+class CombatState(GameModel):
     """Active combat session"""
     active: bool = True
     enemies: List[Enemy]
@@ -51,23 +72,40 @@ class CombatState(BaseModel):
     hero_used_error_handler: bool = False  # Cleric auto-revive
     enemies_defeated: int = 0
 
+    # Number of enemies still standing and turn order length (not serialized, rebuilt on load)
+    _alive_count: int = PrivateAttr(default=0)
+    _turn_order_len: int = PrivateAttr(default=0)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Count the enemies still alive and the turn order slots"""
+        self._alive_count = sum(1 for e in self.enemies if e.hp > 0)
+        self._turn_order_len = len(self.turn_order)
+
     def get_current_turn(self) -> str:
         """Get whose turn it is"""
-        if not self.turn_order:
+        if not self._turn_order_len:
             return "hero"
-        return self.turn_order[self.current_turn_index % len(self.turn_order)]
+        return self.turn_order[self.current_turn_index % self._turn_order_len]
 
     def next_turn(self):
         """Advance to next turn"""
         self.current_turn_index += 1
-        if self.current_turn_index >= len(self.turn_order):
+        if self.current_turn_index >= self._turn_order_len:
             self.current_turn_index = 0
             self.round_num += 1
 
+    def mark_enemy_defeated(self) -> None:
+        """Record that an enemy in this combat has been defeated"""
+        self.enemies_defeated += 1
+        if self._alive_count > 0:
+            self._alive_count -= 1
+
     def get_alive_enemies(self) -> List[Enemy]:
-        """Get list of enemies still alive"""
+        """Get list of enemies still alive (the enemies list itself if none have fallen)"""
+        if self._alive_count == len(self.enemies):
+            return self.enemies
         return [e for e in self.enemies if e.hp > 0]
 
     def is_combat_over(self) -> bool:
         """Check if combat has ended"""
-        return len(self.get_alive_enemies()) == 0 or not self.active
+        return self._alive_count == 0 or not self.active
@@ -2,21 +2,59 @@
 Hero character model with stats, inventory, and equipment.
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Literal
+from enum import StrEnum
+from functools import lru_cache
+from pydantic import Field, PrivateAttr, field_validator
+from typing import Any, Dict, List, Optional, Literal
+from config import BASE_STATS, CLASS_BONUSES, MAX_INVENTORY_SIZE
+from .base import GameModel
 from .items import EquipmentSlots, InventoryItem, Weapon, Armor, Consumable
 
 
-class StatusEffect(BaseModel):
+class StatusEffectType(StrEnum):
+    """Kinds of status effect a character can carry"""
+    RATE_LIMITED = "rate_limited"
+    AUTH_EXPIRED = "auth_expired"
+    TRANSFORMED = "transformed"
+    BUFFERED = "buffered"
+    CACHED = "cached"
+    DEBUGGING = "debugging"
+    THROTTLED = "throttled"
+
+
+@lru_cache(maxsize=256)
+def _max_uptime(role: str, error_resilience: int, recipe_fragments: int) -> int:
+    """Max HP for a given class, CON and fragment count"""
+    base_hp = BASE_STATS["hp"]
+    class_mod = CLASS_BONUSES[role]["hp_mod"]
+    con_bonus = error_resilience * 5
+    fragment_bonus = (recipe_fragments // 3) * 5
+    return base_hp + class_mod + con_bonus + fragment_bonus
+
+
+@lru_cache(maxsize=256)
+def _max_api_credits(role: str, formula_power: int) -> int:
+    """Max MP for a given class and INT"""
+    base_mp = BASE_STATS["mp"]
+    class_mod = CLASS_BONUSES[role]["mp_mod"]
+    int_bonus = formula_power * 3
+    return base_mp + class_mod + int_bonus
+
+
+# Armor granted by status effects while they are active
+_STATUS_ARMOR_BONUS = {StatusEffectType.CACHED: 3}
+
+
+class StatusEffect(GameModel):
     """Active status effect on character"""
     name: str
-    effect_type: Literal["rate_limited", "auth_expired", "transformed", "buffered", "cached", "debugging", "throttled"]
+    effect_type: StatusEffectType
     duration: int  # Turns remaining, -1 for permanent
     description: str
     stat_modifier: Optional[dict[str, int]] = None
 
 
-class Hero(BaseModel):
+class Hero(GameModel):
     """Integration Hero character"""
 
     # Identity
@@ -42,7 +80,7 @@ class Hero(BaseModel):
     equipped: EquipmentSlots = Field(default_factory=EquipmentSlots)
 
     # Status & Progression
-    status_effects: List[StatusEffect] = Field(default_factory=list)
+    status_effects: Dict[StatusEffectType, StatusEffect] = Field(default_factory=dict)
     gold: int = 0
     skills: List[str] = Field(default_factory=list)
 
@@ -53,60 +91,127 @@ class Hero(BaseModel):
     god_mode_active: bool = Field(default=False, description="Whether god mode is currently active")
     saved_stats: Optional[dict] = Field(default=None, description="Original stats before god mode")
 
+    # Lookup indices (not serialized, rebuilt whenever a Hero is created or loaded)
+    _inventory_index: Dict[str, InventoryItem] = PrivateAttr(default_factory=dict)
+    _name_index: Dict[str, List[InventoryItem]] = PrivateAttr(default_factory=dict)  # every stack per name
+    _status_index: Dict[str, StatusEffect] = PrivateAttr(default_factory=dict)
+    _status_armor_bonus: int = PrivateAttr(default=0)
+
+    @field_validator("status_effects", mode="before")
+    @classmethod
+    def _list_status_effects(cls, value: Any) -> Any:
+        """Accept the list layout older saves use"""
+        if isinstance(value, list):
+            # Provisional keys; _key_status_effects rebuilds them from the validated effects
+            return {
+                effect.get("effect_type") if isinstance(effect, dict) else effect.effect_type: effect
+                for effect in value
+            }
+        return value
+
+    @field_validator("status_effects", mode="after")
+    @classmethod
+    def _key_status_effects(
+        cls, value: Dict[StatusEffectType, StatusEffect]
+    ) -> Dict[StatusEffectType, StatusEffect]:
+        """Key every effect by its own effect_type; saves are untrusted, so don't rely on their keys"""
+        return {effect.effect_type: effect for effect in value.values()}
+
+    def model_post_init(self, __context: Any) -> None:
+        """Build the inventory and status effect indices"""
+        self._inventory_index = {inv_item.item.id: inv_item for inv_item in self.inventory}
+        self._name_index = {}
+        for inv_item in self.inventory:
+            self._name_index.setdefault(inv_item.item.name.lower(), []).append(inv_item)
+        self._status_index = {effect.name: effect for effect in self.status_effects.values()}
+        self._status_armor_bonus = sum(
+            _STATUS_ARMOR_BONUS.get(effect_type, 0) for effect_type in self.status_effects
+        )
+
     def calculate_max_uptime(self) -> int:
         """Calculate max HP based on CON and class"""
-        from config import BASE_STATS, CLASS_BONUSES
-        base_hp = BASE_STATS["hp"]
-        class_mod = CLASS_BONUSES[self.role]["hp_mod"]
-        con_bonus = self.error_resilience * 5
-        fragment_bonus = (self.recipe_fragments // 3) * 5
-        return base_hp + class_mod + con_bonus + fragment_bonus
+        return _max_uptime(self.role, self.error_resilience, self.recipe_fragments)
 
     def calculate_max_api_credits(self) -> int:
         """Calculate max MP based on INT and class"""
-        from config import BASE_STATS, CLASS_BONUSES
-        base_mp = BASE_STATS["mp"]
-        class_mod = CLASS_BONUSES[self.role]["mp_mod"]
-        int_bonus = self.formula_power * 3
-        return base_mp + class_mod + int_bonus
+        return _max_api_credits(self.role, self.formula_power)
 
     def has_status(self, status_name: str) -> bool:
         """Check if hero has a specific status effect"""
-        return any(effect.name == status_name for effect in self.status_effects)
+        return status_name in self._status_index
+
+    def get_status_effect(self, effect_type: str) -> Optional[StatusEffect]:
+        """Active status effect of a given type, if any"""
+        return self.status_effects.get(effect_type)
+
+    def add_status_effect(self, effect: StatusEffect) -> None:
+        """Attach a status effect to the hero, replacing any of the same type"""
+        existing = self.status_effects.get(effect.effect_type)
+        if existing is not None:
+            self.remove_status_effect(existing.name)
+        self.status_effects[effect.effect_type] = effect
+        self._status_index[effect.name] = effect
+        self._status_armor_bonus += _STATUS_ARMOR_BONUS.get(effect.effect_type, 0)
+
+    def remove_status_effect(self, status_name: str) -> bool:
+        """Remove a status effect by name, returns False if not found"""
+        effect = self._status_index.pop(status_name, None)
+        if effect is None:
+            return False
+        del self.status_effects[effect.effect_type]
+        self._status_armor_bonus -= _STATUS_ARMOR_BONUS.get(effect.effect_type, 0)
+        return True
 
     def add_to_inventory(self, item: Weapon | Armor | Consumable, quantity: int = 1) -> bool:
         """Add item to inventory, returns False if full"""
-        from config import MAX_INVENTORY_SIZE
-
         # Check if item already exists in inventory
-        for inv_item in self.inventory:
-            if inv_item.item.id == item.id:
-                inv_item.quantity += quantity
-                return True
+        inv_item = self._inventory_index.get(item.id)
+        if inv_item is not None:
+            inv_item.quantity += quantity
+            return True
 
         # Check inventory space
         if len(self.inventory) >= MAX_INVENTORY_SIZE:
             return False
 
         # Add new item
-        self.inventory.append(InventoryItem(item=item, quantity=quantity))
+        inv_item = InventoryItem.model_construct(item=item, quantity=quantity)
+        self.inventory.append(inv_item)
+        self._inventory_index[item.id] = inv_item
+        self._name_index.setdefault(item.name.lower(), []).append(inv_item)
         return True
 
     def remove_from_inventory(self, item_id: str, quantity: int = 1) -> bool:
         """Remove item from inventory, returns False if not found"""
-        for i, inv_item in enumerate(self.inventory):
-            if inv_item.item.id == item_id:
-                inv_item.quantity -= quantity
-                if inv_item.quantity <= 0:
-                    self.inventory.pop(i)
-                return True
-        return False
+        inv_item = self._inventory_index.get(item_id)
+        if inv_item is None:
+            return False
+
+        inv_item.quantity -= quantity
+        if inv_item.quantity <= 0:
+            self.inventory.remove(inv_item)
+            del self._inventory_index[item_id]
+            name = inv_item.item.name.lower()
+            same_name = self._name_index[name]
+            same_name.remove(inv_item)
+            if not same_name:
+                del self._name_index[name]
+        return True
+
+    def find_inventory(self, name: str, item_type: Optional[type] = None) -> Optional[InventoryItem]:
+        """Find an inventory entry by item name (exact, then partial match), case-insensitive"""
+        query = name.lower()
+        for inv_item in self._name_index.get(query, ()):
+            if item_type is None or isinstance(inv_item.item, item_type):
+                return inv_item
+
+        # Partial matches in inventory order, as a plain scan would find them
+        for inv_item in self.inventory:
+            if query in inv_item.item.name.lower() and (item_type is None or isinstance(inv_item.item, item_type)):
+                return inv_item
+        return None
 
     def get_armor_value(self) -> int:
         """Get total armor/protection value"""
         base_armor = self.equipped.armor.protection if self.equipped.armor else 0
-        # Add any status effect bonuses
-        for effect in self.status_effects:
-            if effect.effect_type == "cached":
-                base_armor += 3
-        return base_armor
+        return base_armor + self._status_armor_bonus
@@ -2,60 +2,132 @@
 Item models for weapons, armor, and consumables.
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, Literal
+from enum import StrEnum
+from pydantic import ConfigDict, Discriminator, Field, Tag
+from typing import Annotated, Any, Optional, Literal, Union
+from .base import GameModel
 
 
-class Item(BaseModel):
+class Tier(StrEnum):
+    """Item rarity tier"""
+    COMMON = "common"
+    UNCOMMON = "uncommon"
+    RARE = "rare"
+    LEGENDARY = "legendary"
+    EPIC = "epic"
+
+
+class ConsumableEffect(StrEnum):
+    """What a consumable does when used"""
+    HEAL_HP = "heal_hp"
+    HEAL_MP = "heal_mp"
+    CURE_STATUS = "cure_status"
+    REVEAL_INFO = "reveal_info"
+    ESCAPE = "escape"
+    BUFF = "buff"
+    SPECIAL = "special"
+
+
+class Item(GameModel):
     """Base item model"""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     description: str
-    tier: Literal["common", "uncommon", "rare", "legendary", "epic"]
+    tier: Tier
     item_type: Literal["weapon", "armor", "consumable"]
 
 
-class Weapon(BaseModel):
+class Weapon(GameModel):
     """Connector weapons"""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     description: str
-    tier: Literal["common", "uncommon", "rare", "legendary", "epic"]
+    tier: Tier
     damage_dice: str  # e.g., "2d6", "3d8"
     special_effect: Optional[str] = None
     drop_rate: float  # 0.0 to 1.0
 
 
-class Armor(BaseModel):
+class Armor(GameModel):
     """Error handler armor"""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     description: str
-    tier: Literal["common", "uncommon", "rare", "legendary", "epic"]
+    tier: Tier
     protection: int
     special_effect: Optional[str] = None
     drop_rate: float  # 0.0 to 1.0
 
 
-class Consumable(BaseModel):
+class Consumable(GameModel):
     """Recipe component consumables"""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     description: str
-    effect_type: Literal["heal_hp", "heal_mp", "cure_status", "reveal_info", "escape", "buff", "special"]
+    effect_type: ConsumableEffect
     effect_value: int | str  # Amount for heals, or string for special effects
     drop_rate: float  # 0.0 to 1.0
     single_use: bool = True
 
 
-class EquipmentSlots(BaseModel):
+def item_tag(value: Any) -> Optional[str]:
+    """Kind of item a model or raw dict holds ("weapon", "armor", ...); picks the union member"""
+    if isinstance(value, dict):
+        # Saves don't store a type tag, so infer it from the distinguishing field
+        if "damage_dice" in value:
+            return "weapon"
+        if "protection" in value:
+            return "armor"
+        if "effect_type" in value:
+            return "consumable"
+        return "item"
+    tag = _ITEM_TAGS.get(type(value))
+    if tag is None:
+        # Subclasses take their base item's tag
+        tag = next((_ITEM_TAGS[cls] for cls in type(value).__mro__ if cls in _ITEM_TAGS), None)
+    return tag
+
+
+_ITEM_TAGS = {Item: "item", Weapon: "weapon", Armor: "armor", Consumable: "consumable"}
+
+# Any droppable item (what rooms hold)
+LootItem = Annotated[
+    Union[
+        Annotated[Weapon, Tag("weapon")],
+        Annotated[Armor, Tag("armor")],
+        Annotated[Consumable, Tag("consumable")],
+    ],
+    Discriminator(item_tag),
+]
+
+# Anything that can sit in an inventory slot
+AnyItem = Annotated[
+    Union[
+        Annotated[Item, Tag("item")],
+        Annotated[Weapon, Tag("weapon")],
+        Annotated[Armor, Tag("armor")],
+        Annotated[Consumable, Tag("consumable")],
+    ],
+    Discriminator(item_tag),
+]
+
+
+class EquipmentSlots(GameModel):
     """Character equipment slots"""
     weapon: Optional[Weapon] = None
     armor: Optional[Armor] = None
     accessory: Optional[str] = None  # Future expansion
 
 
-class InventoryItem(BaseModel):
+class InventoryItem(GameModel):
     """Item in inventory with quantity"""
-    item: Item | Weapon | Armor | Consumable
+    item: AnyItem
     quantity: int = 1
@@ -2,17 +2,34 @@
 World, room, and game state models.
 """
 
-from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Literal, Any
+from datetime import datetime
+from enum import StrEnum
+from pydantic import Field, PrivateAttr
+from typing import Dict, Iterator, List, Optional, Any
+from .base import GameModel
 from .hero import Hero
 from .combat import CombatState, Enemy
-from .items import Weapon, Armor, Consumable
+from .items import LootItem
 
 
-class Room(BaseModel):
+def _now_iso() -> str:
+    """Current local time as an ISO 8601 string"""
+    return datetime.now().isoformat()
+
+
+class RoomType(StrEnum):
+    """Kinds of dungeon room"""
+    CORRIDOR = "corridor"
+    CHAMBER = "chamber"
+    TREASURE = "treasure"
+    TRAP = "trap"
+    BOSS = "boss"
+
+
+class Room(GameModel):
     """A room/area in the dungeon"""
     id: str
-    room_type: Literal["corridor", "chamber", "treasure", "trap", "boss"]
+    room_type: RoomType
     system_name: str  # e.g., "Salesforce Org", "Legacy FTP"
     description: str
 
@@ -20,7 +37,7 @@ class Room(BaseModel):
     exits: Dict[str, str] = Field(default_factory=dict)  # {"north": "room_id_2", "east": "room_id_3"}
 
     # Contents
-    items: List[Weapon | Armor | Consumable] = Field(default_factory=list)
+    items: List[LootItem] = Field(default_factory=list)
     enemies: List[Enemy] = Field(default_factory=list)
 
     # State
@@ -28,8 +45,67 @@ class Room(BaseModel):
     is_discovered: bool = False
     depth: int = 1  # How deep in the dungeon
 
-
-class GameState(BaseModel):
+    # Enemy tallies (not serialized, rebuilt on load; kept current by add_enemies/mark_enemy_defeated)
+    _alive_count: int = PrivateAttr(default=0)
+    _total_xp_reward: int = PrivateAttr(default=0)
+    _total_gold_reward: int = PrivateAttr(default=0)
+    _enemy_by_name: Dict[str, Enemy] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Tally the room's enemies and their rewards"""
+        self._alive_count = sum(1 for enemy in self.enemies if enemy.hp > 0)
+        self._total_xp_reward = sum(enemy.xp_reward for enemy in self.enemies)
+        self._total_gold_reward = sum(enemy.gold_reward for enemy in self.enemies)
+        self._enemy_by_name = {}
+        for enemy in self.enemies:
+            self._enemy_by_name.setdefault(enemy.name.lower(), enemy)
+
+    def add_enemies(self, enemies: List[Enemy]) -> None:
+        """Place enemies in the room"""
+        self.enemies.extend(enemies)
+        for enemy in enemies:
+            if enemy.hp > 0:
+                self._alive_count += 1
+            self._enemy_by_name.setdefault(enemy.name.lower(), enemy)
+            self._total_xp_reward += enemy.xp_reward
+            self._total_gold_reward += enemy.gold_reward
+
+    def mark_enemy_defeated(self) -> None:
+        """Record that an enemy in this room has been defeated"""
+        if self._alive_count > 0:
+            self._alive_count -= 1
+
+    def all_enemies_defeated(self) -> bool:
+        """Check if every enemy in the room has been defeated"""
+        return self._alive_count == 0
+
+    def total_rewards(self) -> tuple[int, int]:
+        """Get the combined (xp, gold) reward for all enemies in the room"""
+        return self._total_xp_reward, self._total_gold_reward
+
+    def iter_alive(self) -> Iterator[Enemy]:
+        """Yield the enemies in this room that are still standing"""
+        return (enemy for enemy in self.enemies if enemy.hp > 0)
+
+    def any_alive(self) -> bool:
+        """Check if any enemy in this room is still standing"""
+        return any(enemy.hp > 0 for enemy in self.enemies)
+
+    def find_enemy(self, name: str) -> Optional[Enemy]:
+        """Find a living enemy by name (exact, then partial match), case-insensitive"""
+        query = name.lower()
+        enemy = self._enemy_by_name.get(query)
+        if enemy is not None and enemy.hp > 0:
+            return enemy
+        return next((enemy for enemy in self.iter_alive() if enemy.matches(query)), None)
+
+    def find_item(self, name: str) -> Optional[LootItem]:
+        """Find an item lying in the room by (partial) name, case-insensitive"""
+        query = name.lower()
+        return next((item for item in self.items if query in item.name.lower()), None)
+
+
+class GameState(GameModel):
     """Complete game state for a player"""
 
     # Player character
@@ -52,12 +128,18 @@ class GameState(BaseModel):
 
     # Meta
     save_id: Optional[str] = None
-    created_at: str = Field(default_factory=lambda: __import__("datetime").datetime.now().isoformat())
-    last_updated: str = Field(default_factory=lambda: __import__("datetime").datetime.now().isoformat())
+    created_at: str = Field(default_factory=_now_iso)
+    last_updated: str = Field(default_factory=_now_iso)
+
+    # Last room returned by get_current_room (not serialized)
+    _room_cache: Optional[Room] = PrivateAttr(default=None)
 
     def get_current_room(self) -> Room:
         """Get the room the hero is currently in"""
-        return self.dungeon_map[self.current_room_id]
+        room = self._room_cache
+        if room is None or room.id != self.current_room_id:
+            room = self._room_cache = self.dungeon_map[self.current_room_id]
+        return room
 
     def is_in_combat(self) -> bool:
         """Check if currently in combat"""
@@ -65,4 +147,4 @@ class GameState(BaseModel):
 
     def update_timestamp(self):
         """Update the last_updated timestamp"""
-        self.last_updated = __import__("datetime").datetime.now().isoformat()
+        self.last_updated = _now_iso()
@@ -19,25 +19,11 @@ if sys.platform == 'win32':
     if sys.stderr.encoding != 'utf-8':
         sys.stderr.reconfigure(encoding='utf-8')
 
-# Import all the game tools from server
-import server
-
-# Extract the actual functions from FastMCP wrapped tools
-create_character = server.create_character.fn
-view_status = server.view_status.fn
-explore = server.explore.fn
-examine = server.examine.fn
-move = server.move.fn
-attack = server.attack.fn
-defend = server.defend.fn
-use_item = server.use_item.fn
-pickup = server.pickup.fn
-equip = server.equip.fn
-rest = server.rest.fn
-flee = server.flee.fn
-save_game = server.save_game.fn
-load_game = server.load_game.fn
-game_states = server.game_states
+# Import the game tools directly; the FastMCP server isn't needed to play locally
+from game_tools import (
+    create_character, view_status, explore, examine, move, attack, defend,
+    use_item, pickup, equip, rest, flee, save_game, load_game, game_states
+)
 
 
 def print_banner():
@@ -120,16 +106,128 @@ def get_input(prompt=">>> "):
 
 
 def parse_command(command_str):
-    """Parse user command into action and arguments"""
-    parts = command_str.strip().split(maxsplit=2)
+    """Parse user command into action and the raw argument string"""
+    # Split on any whitespace and collapse runs inside the argument, like str.split()
+    parts = command_str.split(maxsplit=1)
 
     if not parts:
-        return None, []
+        return None, ""
 
-    action = parts[0].lower()
-    args = parts[1:] if len(parts) > 1 else []
+    action, *rest = parts
+    return action.lower(), " ".join(rest[0].split()) if rest else ""
 
-    return action, args
+
+# ============================================================================
+# COMMAND HANDLERS
+# ============================================================================
+
+_QUIT_COMMANDS = frozenset({"quit", "exit", "q"})
+_DIRECTIONS = frozenset({"north", "south", "east", "west"})
+
+
+def _do_help(args):
+    show_help()
+
+
+def _do_status(args):
+    print_narrative(view_status())
+
+
+def _do_explore(args):
+    print_narrative(explore())
+
+
+def _do_examine(args):
+    if not args:
+        print("❌ Usage: examine <target>")
+        return
+    print_narrative(examine(args))
+
+
+def _do_move(args):
+    if not args:
+        print("❌ Usage: move <north|south|east|west>")
+        return
+    direction = args.partition(" ")[0].lower()
+    if direction not in _DIRECTIONS:
+        print("❌ Invalid direction. Use: north, south, east, or west")
+        return
+    print_narrative(move(direction))
+
+
+def _do_attack(args):
+    if not args:
+        print("❌ Usage: attack <enemy> [skill]")
+        return
+
+    # First word is the target, the rest (if any) is the skill
+    target, _, skill = args.partition(" ")
+    skill = skill.strip() or "basic_attack"
+
+    print_narrative(attack(target, skill))
+
+
+def _do_defend(args):
+    print_narrative(defend())
+
+
+def _do_flee(args):
+    print_narrative(flee())
+
+
+def _do_pickup(args):
+    if not args:
+        print("❌ Usage: pickup <item>")
+        return
+    print_narrative(pickup(args))
+
+
+def _do_equip(args):
+    if not args:
+        print("❌ Usage: equip <item>")
+        return
+    print_narrative(equip(args))
+
+
+def _do_use(args):
+    if not args:
+        print("❌ Usage: use <item>")
+        return
+    print_narrative(use_item(args))
+
+
+def _do_rest(args):
+    print_narrative(rest())
+
+
+def _do_save(args):
+    print_narrative(save_game())
+
+
+def _do_load(args):
+    if not args:
+        print("❌ Usage: load <save_id>")
+        return
+    print_narrative(load_game(args.partition(" ")[0]))
+
+
+# Command name (and aliases) -> handler
+_COMMANDS = {
+    "help": _do_help, "h": _do_help, "?": _do_help,
+    "status": _do_status,
+    "explore": _do_explore,
+    "examine": _do_examine, "inspect": _do_examine,
+    "move": _do_move, "go": _do_move,
+    "attack": _do_attack,
+    "defend": _do_defend,
+    "flee": _do_flee, "escape": _do_flee,
+    "pickup": _do_pickup, "take": _do_pickup, "get": _do_pickup,
+    "equip": _do_equip, "wear": _do_equip,
+    "use": _do_use,
+    "rest": _do_rest, "sleep": _do_rest,
+    "save": _do_save,
+    "load": _do_load,
+}
 
 
 def main():
@@ -190,7 +288,7 @@ def main():
         action, args = parse_command(command_str)
 
         # Handle commands
-        if action in ["quit", "exit", "q"]:
+        if action in _QUIT_COMMANDS:
             response = get_input("\n💾 Save before quitting? (y/n): ")
             if response.lower() == 'y':
                 result = save_game()
@@ -199,102 +297,9 @@ def main():
             print("May your APIs always return 200 OK! ⚡\n")
             break
 
-        elif action in ["help", "h", "?"]:
-            show_help()
-
-        elif action == "status":
-            result = view_status()
-            print_narrative(result)
-
-        elif action == "explore":
-            result = explore()
-            print_narrative(result)
-
-        elif action == "examine" or action == "inspect":
-            if not args:
-                print("❌ Usage: examine <target>")
-                continue
-            target = " ".join(args)
-            result = examine(target)
-            print_narrative(result)
-
-        elif action in ["move", "go"]:
-            if not args:
-                print("❌ Usage: move <north|south|east|west>")
-                continue
-            direction = args[0].lower()
-            if direction not in ["north", "south", "east", "west"]:
-                print("❌ Invalid direction. Use: north, south, east, or west")
-                continue
-            result = move(direction)
-            print_narrative(result)
-
-        elif action == "attack":
-            if not args:
-                print("❌ Usage: attack <enemy> [skill]")
-                continue
-
-            # Parse target and optional skill
-            if len(args) == 1:
-                target = args[0]
-                skill = "basic_attack"
-            else:
-                # Everything except last word is target, last word might be skill
-                # Or if 2+ words, first is target, rest is skill
-                target = args[0]
-                skill = args[1] if len(args) > 1 else "basic_attack"
-
-            result = attack(target, skill)
-            print_narrative(result)
-
-        elif action == "defend":
-            result = defend()
-            print_narrative(result)
-
-        elif action == "flee" or action == "escape":
-            result = flee()
-            print_narrative(result)
-
-        elif action == "pickup" or action == "take" or action == "get":
-            if not args:
-                print("❌ Usage: pickup <item>")
-                continue
-            item = " ".join(args)
-            result = pickup(item)
-            print_narrative(result)
-
-        elif action == "equip" or action == "wear":
-            if not args:
-                print("❌ Usage: equip <item>")
-                continue
-            item = " ".join(args)
-            result = equip(item)
-            print_narrative(result)
-
-        elif action == "use":
-            if not args:
-                print("❌ Usage: use <item>")
-                continue
-            item = " ".join(args)
-            result = use_item(item)
-            print_narrative(result)
-
-        elif action == "rest" or action == "sleep":
-            result = rest()
-            print_narrative(result)
-
-        elif action == "save":
-            result = save_game()
-            print_narrative(result)
-
-        elif action == "load":
-            if not args:
-                print("❌ Usage: load <save_id>")
-                continue
-            save_id = args[0]
-            result = load_game(save_id)
-            print_narrative(result)
-
+        handler = _COMMANDS.get(action)
+        if handler:
+            handler(args)
         else:
             print(f"❓ Unknown command: '{action}'. Type 'help' for available commands.")
 
@@ -8,6 +8,7 @@ Usage:
     uv run python remote_server.py
 """
 
+import os
 import sys
 
 # Force UTF-8 encoding for Windows console
@@ -21,6 +22,11 @@ if sys.platform == 'win32':
 # Note: server.py automatically loads the latest save on import
 from server import mcp, game_states
 
+# Opt-in stateless streamable HTTP: no per-connection server state, so requests
+# can be spread across workers without sticky sessions. Game state itself is
+# still in-process, keyed by each tool's session_id argument.
+STATELESS_HTTP = os.environ.get("STATELESS_HTTP", "").lower() in ("1", "true", "yes")
+
 
 if __name__ == "__main__":
     print("""
@@ -43,9 +49,13 @@ if __name__ == "__main__":
     else:
         print("No save found. Create a character to begin your quest!")
 
-    print("\n🎮 Server ready! Connect via MCP client at http://localhost:8000/sse")
+    endpoint = "mcp" if STATELESS_HTTP else "sse"
+    print(f"\n🎮 Server ready! Connect via MCP client at http://localhost:8000/{endpoint}")
     print("=" * 63 + "\n")
 
-    # Run the MCP server in remote mode with SSE transport
+    # Run the MCP server in remote mode
     # This will start an HTTP server that clients can connect to
-    mcp.run(transport="sse")
+    if STATELESS_HTTP:
+        mcp.run(transport="http", stateless_http=True)
+    else:
+        mcp.run(transport="sse")
@@ -3,6 +3,7 @@ Combat system - damage calculation, turn order, enemy AI.
 """
 
 import random
+import sys
 from typing import Tuple, List, Optional
 from models.hero import Hero
 from models.combat import CombatState, Enemy
@@ -22,12 +23,13 @@ class CombatSystem:
         # Generate turn order (based on DEX/agility)
         turn_order = ["hero"]
         for i, enemy in enumerate(enemies):
-            turn_order.append(f"enemy_{i}")
+            # Interned so turn checks compare by identity first
+            turn_order.append(sys.intern(f"enemy_{i}"))
 
         # Shuffle to add variety (could weight by DEX later)
         random.shuffle(turn_order)
 
-        return CombatState(
+        return CombatState.model_construct(
             active=True,
             enemies=enemies,
             turn_order=turn_order,
@@ -38,15 +40,20 @@ class CombatSystem:
 
     @staticmethod
     def calculate_damage(
-        attacker_stats: dict,
+        attacker_throughput: int,
         weapon: Optional[Weapon],
-        target: Enemy | Hero,
+        target_armor: int,
         skill_multiplier: float = 1.0,
-        ignore_armor: bool = False
+        ignore_armor: bool = False,
+        verbose: bool = True
     ) -> Tuple[int, bool, List[str]]:
         """
         Calculate damage dealt.
 
+        Args:
+            target_armor: Armor value of the defender
+            verbose: Build the combat log messages (skip them when only the numbers are needed)
+
         Returns:
             Tuple of (damage, is_critical, combat_log_messages)
         """
@@ -55,37 +62,26 @@ class CombatSystem:
         # Base damage from weapon
         if weapon:
             base_damage, rolls = roll_dice(weapon.damage_dice)
-            messages.append(f"🎲 Rolled {weapon.damage_dice}: {rolls} = {base_damage}")
+            if verbose:
+                messages.append(f"🎲 Rolled {weapon.damage_dice}: {rolls} = {base_damage}")
         else:
             base_damage = 1  # Unarmed/basic
-            messages.append(f"🎲 Basic attack: 1 damage")
-
-        # Apply STR/throughput bonus
-        str_bonus = attacker_stats.get("throughput", 10) // 5  # +1 per 5 STR
-        base_damage += str_bonus
-
-        # Apply skill multiplier
-        base_damage = int(base_damage * skill_multiplier)
+            if verbose:
+                messages.append(f"🎲 Basic attack: 1 damage")
 
-        # Critical hit check
+        # STR/throughput bonus (+1 per 5 STR), skill multiplier, then critical hit
         is_critical = critical_hit_check()
-        if is_critical:
-            base_damage *= 2
+        base_damage = int((base_damage + attacker_throughput // 5) * skill_multiplier) * (2 if is_critical else 1)
+        if is_critical and verbose:
             messages.append("💥 CRITICAL HIT!")
 
         # Apply armor
-        final_damage = base_damage
-        if not ignore_armor:
-            if isinstance(target, Enemy):
-                armor = target.armor
-            else:
-                armor = target.get_armor_value()
+        if ignore_armor:
+            return base_damage, is_critical, messages
 
-            damage_reduction = armor
-            final_damage = max(1, base_damage - damage_reduction)  # Minimum 1 damage
-
-            if armor > 0:
-                messages.append(f"🛡️ Armor reduced damage by {damage_reduction}")
+        final_damage = max(1, base_damage - target_armor)  # Minimum 1 damage
+        if target_armor > 0 and verbose:
+            messages.append(f"🛡️ Armor reduced damage by {target_armor}")
 
         return final_damage, is_critical, messages
 
@@ -95,11 +91,15 @@ class CombatSystem:
         target: Enemy,
         combat_state: CombatState,
         skill_multiplier: float = 1.0,
-        ignore_armor: bool = False
+        ignore_armor: bool = False,
+        verbose: bool = True
     ) -> dict:
         """
         Hero attacks an enemy.
 
+        Args:
+            verbose: Build the combat log messages (skip them when only the numbers are needed)
+
         Returns:
             Combat result dictionary
         """
@@ -122,17 +122,13 @@ class CombatSystem:
             return result
 
         # Calculate damage
-        attacker_stats = {
-            "throughput": hero.throughput,
-            "formula_power": hero.formula_power
-        }
-
         damage, is_crit, damage_messages = CombatSystem.calculate_damage(
-            attacker_stats=attacker_stats,
+            attacker_throughput=hero.throughput,
             weapon=hero.equipped.weapon,
-            target=target,
+            target_armor=target.armor,
             skill_multiplier=skill_multiplier,
-            ignore_armor=ignore_armor
+            ignore_armor=ignore_armor,
+            verbose=verbose
         )
 
         # Apply status effect modifiers
@@ -144,9 +140,10 @@ class CombatSystem:
 
         # Apply damage to enemy
         target.hp -= damage
-        result["messages"].append(
-            f"⚔️ You hit {target.name} for {damage} damage! ({target.hp}/{target.max_hp} HP remaining)"
-        )
+        if verbose:
+            result["messages"].append(
+                f"⚔️ You hit {target.name} for {damage} damage! ({target.hp}/{target.max_hp} HP remaining)"
+            )
 
         # Check if enemy defeated
         if target.hp <= 0:
@@ -154,24 +151,29 @@ class CombatSystem:
             result["enemy_defeated"] = True
             result["xp_gained"] = target.xp_reward
             result["gold_gained"] = target.gold_reward
-            combat_state.enemies_defeated += 1
+            combat_state.mark_enemy_defeated()
 
-            result["messages"].append(
-                f"✅ {target.name} defeated! +{target.xp_reward} XP, +{target.gold_reward} gold"
-            )
+            if verbose:
+                result["messages"].append(
+                    f"✅ {target.name} defeated! +{target.xp_reward} XP, +{target.gold_reward} gold"
+                )
 
         return result
 
     @staticmethod
-    def enemy_attack(enemy: Enemy, hero: Hero, combat_state: CombatState) -> dict:
+    def enemy_attack(enemy: Enemy, hero: Hero, combat_state: CombatState, verbose: bool = True) -> dict:
         """
         Enemy attacks the hero.
 
+        Args:
+            verbose: Build the combat log messages (skip them when only the numbers are needed)
+
         Returns:
             Combat result dictionary
         """
+        messages = []
         result = {
-            "messages": [],
+            "messages": messages,
             "damage_dealt": 0,
             "hero_defeated": False
         }
@@ -180,34 +182,39 @@ class CombatSystem:
         base_damage, rolls = roll_dice(enemy.damage_dice)
         damage = base_damage
 
-        result["messages"].append(
-            f"{enemy.emoji} {enemy.name} attacks! Rolled {enemy.damage_dice}: {rolls} = {base_damage}"
-        )
+        if verbose:
+            messages.append(
+                f"{enemy.emoji} {enemy.name} attacks! Rolled {enemy.damage_dice}: {rolls} = {base_damage}"
+            )
 
         # Apply defense reduction if hero is defending
         if combat_state.hero_defending:
             damage = int(damage * (1 - DEFENSE_DAMAGE_REDUCTION))
-            result["messages"].append(f"🛡️ Defensive stance reduced damage by 50%!")
+            if verbose:
+                messages.append(f"🛡️ Defensive stance reduced damage by 50%!")
 
         # Apply armor
         armor = hero.get_armor_value()
         if armor > 0:
             damage = max(1, damage - armor)
-            result["messages"].append(f"🛡️ Your armor blocked {armor} damage")
+            if verbose:
+                messages.append(f"🛡️ Your armor blocked {armor} damage")
 
         result["damage_dealt"] = damage
 
         # Apply damage to hero
         hero.uptime -= damage
-        result["messages"].append(
-            f"💔 You took {damage} damage! Uptime: {hero.uptime}/{hero.max_uptime}"
-        )
+        if verbose:
+            messages.append(
+                f"💔 You took {damage} damage! Uptime: {hero.uptime}/{hero.max_uptime}"
+            )
 
         # Check if hero defeated
         if hero.uptime <= 0:
             hero.uptime = 0
             result["hero_defeated"] = True
-            result["messages"].append("💀 Your uptime has reached 0...")
+            if verbose:
+                messages.append("💀 Your uptime has reached 0...")
 
         return result
 
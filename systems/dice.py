@@ -4,7 +4,50 @@ Dice rolling utilities for damage and random checks.
 
 import random
 import re
-from typing import Tuple
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# Dice notation: XdY+Z or XdY-Z or XdY
+_DICE_PATTERN = re.compile(r'(\d+)d(\d+)([+-]\d+)?')
+
+
+@lru_cache(maxsize=None)
+def parse_dice(notation: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Parse dice notation into (num_dice, die_size, modifier).
+
+    Weapons and enemies reuse a handful of notations, so results are cached
+    and each string is only parsed once per process.
+
+    Returns:
+        Parsed tuple, or None if the string is not dice notation
+    """
+    match = _DICE_PATTERN.match(notation.lower().strip())
+
+    if not match:
+        return None
+
+    num_dice = int(match.group(1))
+    die_size = int(match.group(2))
+    modifier = int(match.group(3)) if match.group(3) else 0
+
+    return num_dice, die_size, modifier
+
+
+def roll_parsed(spec: Tuple[int, int, int]) -> Tuple[int, list[int]]:
+    """
+    Roll dice from a tuple returned by parse_dice.
+
+    Returns:
+        Tuple of (total, individual_rolls)
+    """
+    num_dice, die_size, modifier = spec
+    randint = random.randint
+
+    rolls = [randint(1, die_size) for _ in range(num_dice)]
+    total = sum(rolls) + modifier
+
+    return max(0, total), rolls  # Ensure non-negative result
 
 
 def roll_dice(notation: str) -> Tuple[int, list[int]]:
@@ -19,25 +62,16 @@ def roll_dice(notation: str) -> Tuple[int, list[int]]:
         roll_dice("1d8+2") -> (7, [5])
         roll_dice("3d4-1") -> (7, [3, 2, 3])
     """
-    # Parse dice notation: XdY+Z or XdY-Z or XdY
-    match = re.match(r'(\d+)d(\d+)([+-]\d+)?', notation.lower().strip())
+    spec = parse_dice(notation)
 
-    if not match:
+    if spec is None:
         # If not dice notation, try to parse as a simple number
         try:
             return int(notation), []
         except ValueError:
             return 0, []
 
-    num_dice = int(match.group(1))
-    die_size = int(match.group(2))
-    modifier = int(match.group(3)) if match.group(3) else 0
-
-    # Roll the dice
-    rolls = [random.randint(1, die_size) for _ in range(num_dice)]
-    total = sum(rolls) + modifier
-
-    return max(0, total), rolls  # Ensure non-negative result
+    return roll_parsed(spec)
 
 
 def roll_d20() -> int:
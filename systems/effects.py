@@ -3,7 +3,18 @@ Status effect management system.
 """
 
 from typing import List, Optional, Tuple
-from models.hero import Hero, StatusEffect
+from models.hero import Hero, StatusEffect, StatusEffectType
+
+# Damage multipliers granted by status effects (throttled only affects MP costs)
+_DAMAGE_MULTIPLIERS = {
+    StatusEffectType.BUFFERED: 1.25,
+    StatusEffectType.AUTH_EXPIRED: 0.5,
+}
+
+# MP cost multipliers granted by status effects
+_MP_COST_MULTIPLIERS = {
+    StatusEffectType.THROTTLED: 0.5,  # Half MP costs
+}
 
 
 class StatusEffectManager:
@@ -14,38 +25,37 @@ class StatusEffectManager:
         """Apply a status effect to the hero"""
 
         # Check if effect already exists
-        for effect in hero.status_effects:
-            if effect.effect_type == effect_type:
-                # Refresh duration if longer
-                if duration > effect.duration:
-                    effect.duration = duration
-                return
+        effect = hero.get_status_effect(effect_type)
+        if effect is not None:
+            # Refresh duration if longer
+            if duration > effect.duration:
+                effect.duration = duration
+            return
 
         # Add new effect
-        effect = StatusEffect(
+        effect = StatusEffect.model_construct(
             name=effect_type.replace("_", " ").title(),
-            effect_type=effect_type,
+            effect_type=StatusEffectType(effect_type),
             duration=duration,
             description=description
         )
-        hero.status_effects.append(effect)
+        hero.add_status_effect(effect)
 
     @staticmethod
     def remove_effect(hero: Hero, effect_type: str) -> bool:
         """Remove a specific status effect"""
-        for i, effect in enumerate(hero.status_effects):
-            if effect.effect_type == effect_type:
-                hero.status_effects.pop(i)
-                return True
-        return False
+        effect = hero.get_status_effect(effect_type)
+        if effect is None:
+            return False
+        return hero.remove_status_effect(effect.name)
 
     @staticmethod
     def process_turn_effects(hero: Hero) -> List[str]:
         """Process status effects at the start of a turn"""
         messages = []
-        effects_to_remove = []
+        expired = []
 
-        for effect in hero.status_effects:
+        for effect in hero.status_effects.values():
             # Skip permanent effects (-1 duration)
             if effect.duration == -1:
                 continue
@@ -55,12 +65,12 @@ class StatusEffectManager:
 
             # Check if effect expired
             if effect.duration <= 0:
-                effects_to_remove.append(effect.effect_type)
+                expired.append(effect.name)
                 messages.append(f"✨ {effect.name} has worn off!")
 
-        # Remove expired effects
-        for effect_type in effects_to_remove:
-            StatusEffectManager.remove_effect(hero, effect_type)
+        # Remove expired effects (not while iterating the dict)
+        for name in expired:
+            hero.remove_status_effect(name)
 
         return messages
 
@@ -69,14 +79,9 @@ class StatusEffectManager:
         """Get damage multiplier from status effects"""
         modifier = 1.0
 
-        for effect in hero.status_effects:
-            if effect.effect_type == "buffered":
-                modifier *= 1.25
-            elif effect.effect_type == "auth_expired":
-                modifier *= 0.5
-            elif effect.effect_type == "throttled":
-                # Throttled doesn't affect damage, just MP costs
-                pass
+        for effect_type, multiplier in _DAMAGE_MULTIPLIERS.items():
+            if effect_type in hero.status_effects:
+                modifier *= multiplier
 
         return modifier
 
@@ -85,18 +90,17 @@ class StatusEffectManager:
         """Get MP cost multiplier from status effects"""
         modifier = 1.0
 
-        for effect in hero.status_effects:
-            if effect.effect_type == "throttled":
-                modifier *= 0.5  # Half MP costs
+        for effect_type, multiplier in _MP_COST_MULTIPLIERS.items():
+            if effect_type in hero.status_effects:
+                modifier *= multiplier
 
         return modifier
 
     @staticmethod
     def can_act(hero: Hero) -> Tuple[bool, Optional[str]]:
         """Check if hero can act this turn"""
-        for effect in hero.status_effects:
-            if effect.effect_type == "rate_limited":
-                return False, "⏱️ Rate Limited! You must skip this turn."
+        if StatusEffectType.RATE_LIMITED in hero.status_effects:
+            return False, "⏱️ Rate Limited! You must skip this turn."
 
         return True, None
 
@@ -107,7 +111,7 @@ class StatusEffectManager:
             return "None"
 
         effects_str = []
-        for effect in hero.status_effects:
+        for effect in hero.status_effects.values():
             duration_str = f"{effect.duration} turns" if effect.duration > 0 else "Permanent"
             effects_str.append(f"{effect.name} ({duration_str})")
 
@@ -3,33 +3,97 @@ Procedural dungeon and content generation.
 """
 
 import random
-import json
+from bisect import bisect
+from itertools import accumulate, count
 from pathlib import Path
-from typing import List, Dict, Tuple
-from models.world import Room
+from pydantic_core import from_json
+from typing import List, Dict, Optional, Tuple
+from models.world import Room, RoomType
 from models.combat import Enemy
 from models.items import Weapon, Armor, Consumable
 from config import ROOM_WEIGHTS
 
+# Non-boss room types and their cumulative draw weights, for a bisect draw
+_ROOM_TYPES = ("corridor", "chamber", "treasure", "trap")
+_ROOM_CUM_WEIGHTS = tuple(accumulate((0.40, 0.30, 0.15, 0.15)))
+_ROOM_TOTAL_WEIGHT = _ROOM_CUM_WEIGHTS[-1]
+
+
+def _load_data(filename: str) -> dict:
+    """Parse one of the static game data files"""
+    return from_json((Path(__file__).parent.parent / "data" / filename).read_bytes())
+
+
+# Static game data, parsed once per process and shared by every generator
+_ENEMY_DATA = _load_data("enemies.json")
+_ITEM_DATA = _load_data("items.json")
+_DESCRIPTION_DATA = _load_data("descriptions.json")
+
+def _loot_table(pool: List[dict]) -> Tuple[float, ...]:
+    """
+    Cumulative chance of each item in a pool being the one dropped.
+
+    Matches rolling every item against its drop_rate and picking uniformly
+    among the items that pass; the chance left over above the last entry is
+    the chance that nothing drops.
+    """
+    rates = [item.get("drop_rate", 1.0) for item in pool]
+    chances = []
+    for i, rate in enumerate(rates):
+        # Probability that exactly k of the other items pass their roll
+        others = [1.0]
+        for j, other_rate in enumerate(rates):
+            if j != i:
+                others = [
+                    miss * (1 - other_rate) + hit * other_rate
+                    for miss, hit in zip(others + [0.0], [0.0] + others)
+                ]
+        chances.append(rate * sum(p / (k + 1) for k, p in enumerate(others)))
+    return tuple(accumulate(chances))
+
+
+# Loot pools and their drop tables, for one random() draw per item
+_LOOT_POOLS = {item_type: tuple(pool) for item_type, pool in _ITEM_DATA.items()}
+_LOOT_TABLES = {item_type: _loot_table(pool) for item_type, pool in _ITEM_DATA.items()}
+
+# Room flavour text per room type, as tuples for random.choice
+_SYSTEM_NAMES = {
+    room_type: tuple(names) for room_type, names in _DESCRIPTION_DATA["system_names"].items()
+}
+_DESCRIPTIONS = {room_type: tuple(_DESCRIPTION_DATA[room_type]) for room_type in _SYSTEM_NAMES}
+
+# Validated enemies per tier; spawns are copies of these
+_ENEMY_PROTOTYPES = {
+    tier: tuple(Enemy.model_validate(template) for template in pool)
+    for tier, pool in _ENEMY_DATA.items()
+}
+
+# Bosses in the order they guard the dungeon, one every 5 levels
+_BOSSES = _ENEMY_PROTOTYPES["boss"]
 
-class DungeonGenerator:
-    """Generates rooms, enemies, and loot"""
 
-    def __init__(self):
-        """Load game data from JSON files"""
-        data_dir = Path(__file__).parent.parent / "data"
+def _spawn_enemy(prototype: Enemy, hp_multiplier: float) -> Enemy:
+    """Copy a prototype enemy with its HP scaled and fresh runtime state"""
+    hp = int(prototype.hp * hp_multiplier)
+    return prototype.model_copy(update={"hp": hp, "max_hp": hp, "status_effects": []})
 
-        # Load enemies
-        with open(data_dir / "enemies.json", "r", encoding="utf-8") as f:
-            self.enemy_data = json.load(f)
 
-        # Load items
-        with open(data_dir / "items.json", "r", encoding="utf-8") as f:
-            self.item_data = json.load(f)
+class DungeonGenerator:
+    """Generates rooms, enemies, and loot"""
 
-        # Load descriptions
-        with open(data_dir / "descriptions.json", "r", encoding="utf-8") as f:
-            self.description_data = json.load(f)
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Attach the game data loaded from JSON files.
+
+        Args:
+            seed: Seed for this generator's own random stream, or None for an unpredictable one
+        """
+        self._rng = random.Random(seed)
+        # Room ids only need to be unique, so number them instead of rolling them
+        self._room_numbers = count(1)
+        self.enemy_data = _ENEMY_DATA
+        self.item_data = _ITEM_DATA
+        self.description_data = _DESCRIPTION_DATA
 
     def generate_room(self, depth: int, room_type: str = None) -> Room:
         """
@@ -46,23 +110,21 @@ class DungeonGenerator:
             if depth % 5 == 0:
                 room_type = "boss"
             else:
-                room_type = random.choices(
-                    population=["corridor", "chamber", "treasure", "trap"],
-                    weights=[0.40, 0.30, 0.15, 0.15],
-                    k=1
-                )[0]
+                room_type = _ROOM_TYPES[
+                    bisect(_ROOM_CUM_WEIGHTS, self._rng.random() * _ROOM_TOTAL_WEIGHT, 0, len(_ROOM_TYPES) - 1)
+                ]
 
         # Generate room ID
-        room_id = f"{room_type}_{depth}_{random.randint(1000, 9999)}"
+        room_id = f"{room_type}_{depth}_{next(self._room_numbers)}"
 
         # Get description
-        description = random.choice(self.description_data[room_type])
-        system_name = random.choice(self.description_data["system_names"][room_type])
+        description = self._rng.choice(_DESCRIPTIONS[room_type])
+        system_name = self._rng.choice(_SYSTEM_NAMES[room_type])
 
         # Create room
-        room = Room(
+        room = Room.model_construct(
             id=room_id,
-            room_type=room_type,
+            room_type=RoomType(room_type),
             system_name=system_name,
             description=description,
             depth=depth
@@ -70,18 +132,18 @@ class DungeonGenerator:
 
         # Populate room based on type
         if room_type in ["corridor", "chamber"]:
-            room.enemies = self._generate_enemies(depth, room_type)
-            room.items = self._generate_loot(depth, "common", quantity=random.randint(0, 2))
+            room.add_enemies(self._generate_enemies(depth, room_type))
+            room.items = self._generate_loot(depth, "common", quantity=self._rng.randint(0, 2))
 
         elif room_type == "treasure":
-            room.items = self._generate_loot(depth, "uncommon", quantity=random.randint(2, 4))
+            room.items = self._generate_loot(depth, "uncommon", quantity=self._rng.randint(2, 4))
 
         elif room_type == "trap":
-            room.enemies = self._generate_enemies(depth, room_type)
+            room.add_enemies(self._generate_enemies(depth, room_type))
             # Traps have fewer items but more enemies
 
         elif room_type == "boss":
-            room.enemies = self._generate_boss_enemy(depth)
+            room.add_enemies(self._generate_boss_enemy(depth))
 
         return room
 
@@ -93,52 +155,35 @@ class DungeonGenerator:
         # Determine enemy tier based on depth
         if depth <= 3:
             tier = "common"
-            count = random.randint(1, 2)
+            count = self._rng.randint(1, 2)
         elif depth <= 6:
             tier = "uncommon"
-            count = random.randint(1, 3)
+            count = self._rng.randint(1, 3)
         elif depth <= 9:
             tier = "rare"
-            count = random.randint(1, 2)
+            count = self._rng.randint(1, 2)
         else:
             # Mix of tiers
-            tier = random.choice(["uncommon", "rare"])
-            count = random.randint(2, 3)
+            tier = self._rng.choice(["uncommon", "rare"])
+            count = self._rng.randint(2, 3)
 
-        # Generate enemies
-        enemy_pool = self.enemy_data[tier]
+        # Generate enemies, scaling HP based on depth
+        enemy_pool = _ENEMY_PROTOTYPES[tier]
+        hp_multiplier = 1.0 + (depth * 0.1)  # +10% HP per depth
         for i in range(count):
-            enemy_template = random.choice(enemy_pool)
-            enemy = Enemy(**enemy_template)
-
-            # Scale HP based on depth
-            hp_multiplier = 1.0 + (depth * 0.1)  # +10% HP per depth
-            enemy.hp = int(enemy.hp * hp_multiplier)
-            enemy.max_hp = enemy.hp
-
-            enemies.append(enemy)
+            enemies.append(_spawn_enemy(self._rng.choice(enemy_pool), hp_multiplier))
 
         return enemies
 
     def _generate_boss_enemy(self, depth: int) -> List[Enemy]:
         """Generate a boss enemy for the depth"""
 
-        # Determine which boss based on depth
-        boss_index = (depth // 5) - 1
-        boss_pool = self.enemy_data["boss"]
-
-        if boss_index >= len(boss_pool):
-            boss_index = len(boss_pool) - 1  # Use final boss
-
-        boss_template = boss_pool[boss_index]
-        boss = Enemy(**boss_template)
+        # One boss per 5 levels, then the final boss from there on
+        boss = _BOSSES[min(depth // 5, len(_BOSSES)) - 1]
 
         # Scale boss stats
         hp_multiplier = 1.0 + (depth * 0.05)
-        boss.hp = int(boss.hp * hp_multiplier)
-        boss.max_hp = boss.hp
-
-        return [boss]
+        return [_spawn_enemy(boss, hp_multiplier)]
 
     def _generate_loot(self, depth: int, min_tier: str, quantity: int = 1) -> List[Weapon | Armor | Consumable]:
         """Generate random loot items"""
@@ -147,27 +192,23 @@ class DungeonGenerator:
 
         for _ in range(quantity):
             # Randomly choose item type
-            item_type = random.choice(["weapons", "armor", "consumables"])
-            item_pool = self.item_data[item_type]
-
-            # Filter by drop rate and tier
-            available_items = [
-                item for item in item_pool
-                if random.random() < item.get("drop_rate", 1.0)
-            ]
+            item_type = self._rng.choice(["weapons", "armor", "consumables"])
+            item_pool = _LOOT_POOLS[item_type]
 
-            if not available_items:
+            # Pick an item weighted by drop rate, or nothing
+            index = bisect(_LOOT_TABLES[item_type], self._rng.random())
+            if index == len(item_pool):
                 continue
 
-            item_data = random.choice(available_items)
+            item_data = item_pool[index]
 
             # Create appropriate item instance
             if item_type == "weapons":
-                loot.append(Weapon(**item_data))
+                loot.append(Weapon.model_validate(item_data))
             elif item_type == "armor":
-                loot.append(Armor(**item_data))
+                loot.append(Armor.model_validate(item_data))
             else:
-                loot.append(Consumable(**item_data))
+                loot.append(Consumable.model_validate(item_data))
 
         return loot
 
@@ -184,8 +225,9 @@ class DungeonGenerator:
         """
 
         rooms = {}
+        prev_room = None
 
-        # Generate rooms
+        # Generate rooms, connecting each to the last one (linearly for now, can be enhanced later)
         for i in range(room_count):
             # Boss room only at end
             if i == room_count - 1 and depth % 5 == 0:
@@ -195,23 +237,19 @@ class DungeonGenerator:
 
             rooms[room.id] = room
 
-        # Connect rooms linearly for now (can be enhanced later)
-        room_ids = list(rooms.keys())
-        for i in range(len(room_ids) - 1):
-            current_room = rooms[room_ids[i]]
-            next_room_id = room_ids[i + 1]
-
             # Add exits
-            current_room.exits["north"] = next_room_id
+            if prev_room is not None:
+                prev_room.exits["north"] = room.id
+            prev_room = room
 
         return rooms
 
     def create_starting_room(self) -> Room:
         """Create the initial starting room"""
 
-        room = Room(
+        room = Room.model_construct(
             id="start_0",
-            room_type="corridor",
+            room_type=RoomType.CORRIDOR,
             system_name="Integration Hub Entrance",
             description=(
                 "🏛️ **THE INTEGRATION HUB**\n\n"
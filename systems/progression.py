@@ -8,14 +8,30 @@ from models.hero import Hero
 from config import LEVEL_UP_MESSAGES
 
 
+def _xp_formula(level: int) -> int:
+    """XP needed to reach a level"""
+    # Formula: 100 * level^1.5
+    return int(100 * (level ** 1.5))
+
+
+# XP requirements for every level a hero realistically reaches, built once
+_XP_TABLE = tuple(_xp_formula(level) for level in range(101))
+
+
+def _xp_required(level: int) -> int:
+    """Table lookup, falling back to the formula past the end of the table"""
+    if level < len(_XP_TABLE):
+        return _XP_TABLE[level]
+    return _xp_formula(level)
+
+
 class ProgressionSystem:
     """Handles XP, leveling, and stat growth"""
 
     @staticmethod
     def xp_required_for_level(level: int) -> int:
         """Calculate XP required to reach a level"""
-        # Formula: 100 * level^1.5
-        return int(100 * (level ** 1.5))
+        return _xp_required(level)
 
     @staticmethod
     def add_experience(hero: Hero, xp: int) -> Tuple[bool, List[str]]:
@@ -31,8 +47,8 @@ class ProgressionSystem:
 
         # Check for level up
         leveled_up = False
-        while hero.xp >= ProgressionSystem.xp_required_for_level(hero.level + 1):
-            hero.xp -= ProgressionSystem.xp_required_for_level(hero.level + 1)
+        while hero.xp >= (xp_needed := _xp_required(hero.level + 1)):
+            hero.xp -= xp_needed
             hero.level += 1
             leveled_up = True
 
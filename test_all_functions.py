@@ -13,6 +13,7 @@ Usage:
 import sys
 import os
 import json
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -25,16 +26,12 @@ if sys.platform == 'win32':
 
 # Import game functions
 import server
+from models.items import Weapon, Armor, Consumable
 
 # Extract functions from FastMCP wrapped tools
 def get_function(tool):
-    """Extract the actual function from a FastMCP tool"""
-    if hasattr(tool, 'fn'):
-        return tool.fn
-    elif callable(tool):
-        return tool
-    else:
-        raise ValueError(f"Cannot extract function from {tool}")
+    """Extract the actual function from a FastMCP tool (plain functions pass through)"""
+    return getattr(tool, 'fn', tool)
 
 create_character = get_function(server.create_character)
 view_status = get_function(server.view_status)
@@ -59,15 +56,23 @@ class FunctionTester:
     def __init__(self):
         self.tests_passed = 0
         self.tests_failed = 0
-        self.test_log = []
         self.log_file = Path(__file__).parent / "logs" / f"function_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
         self.log_file.parent.mkdir(exist_ok=True)
+        # Lines are written as they are logged, so a crashed run still leaves its log behind
+        self._log_fh = open(self.log_file, 'w', encoding='utf-8')
+        # Timestamps have 1-second resolution, so format each second only once
+        self._ts_second = 0
+        self._ts_text = ""
 
     def log(self, message: str, status: str = "INFO"):
         """Log a test message"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_line = f"[{timestamp}] [{status}] {message}"
-        self.test_log.append(log_line)
+        now = int(time.time())
+        if now != self._ts_second:
+            self._ts_second = now
+            self._ts_text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        log_line = f"[{self._ts_text}] [{status}] {message}"
+        if not self._log_fh.closed:
+            self._log_fh.write(log_line + "\n")
         print(log_line)
 
     def assert_test(self, condition: bool, test_name: str, error_msg: str = ""):
@@ -176,7 +181,7 @@ class FunctionTester:
             )
 
             # Test equip if it's equipment
-            if hasattr(item, 'damage_dice') or hasattr(item, 'protection'):
+            if isinstance(item, (Weapon, Armor)):
                 result = equip(item=item_name)
                 self.assert_test(
                     "error" not in result,
@@ -188,7 +193,7 @@ class FunctionTester:
         if state.hero.inventory:
             # Find a consumable
             for inv_item in state.hero.inventory:
-                if hasattr(inv_item.item, 'effect_type'):
+                if isinstance(inv_item.item, Consumable):
                     result = use_item(item=inv_item.item.name)
                     self.assert_test(
                         "error" not in result,
@@ -224,8 +229,7 @@ class FunctionTester:
                 result.get("error", "")
             )
 
-            # Verify room changed
-            state = game_states.get("default")
+            # Verify room changed (move updates the same state object)
             self.assert_test(
                 state.current_room_id != initial_room_id,
                 "Room changed after move"
@@ -240,15 +244,15 @@ class FunctionTester:
 
         state = game_states.get("default")
 
-        # Find a room with enemies
-        enemy_room = None
+        # Rooms with enemies, consumed as they get used up
+        enemy_rooms = {room_id: room for room_id, room in state.dungeon_map.items() if room.enemies}
+
+        # Go to the first room with enemies
         enemy = None
-        for room_id, room in state.dungeon_map.items():
-            if room.enemies and len(room.enemies) > 0:
-                enemy_room = room
-                enemy = room.enemies[0]
-                state.current_room_id = room_id
-                break
+        if enemy_rooms:
+            room_id, room = next(iter(enemy_rooms.items()))
+            enemy = room.enemies[0]
+            state.current_room_id = room_id
 
         if enemy:
             # Test basic attack
@@ -260,18 +264,17 @@ class FunctionTester:
             )
 
             # Test skill attack if hero has skills
-            state = game_states.get("default")
             if state.hero.skills and state.hero.api_credits > 10:
                 skill = state.hero.skills[0]
 
                 # Recreate enemy if defeated
                 if state.combat is None:
-                    # Find another enemy room
-                    for room_id, room in state.dungeon_map.items():
-                        if room.enemies and len(room.enemies) > 0:
-                            state.current_room_id = room_id
-                            enemy = room.enemies[0]
-                            break
+                    # Move on to another enemy room
+                    enemy_rooms.pop(state.current_room_id, None)
+                    if enemy_rooms:
+                        room_id, room = next(iter(enemy_rooms.items()))
+                        state.current_room_id = room_id
+                        enemy = room.enemies[0]
 
                 if enemy:
                     result = attack(target=enemy.name, skill=skill)
@@ -282,7 +285,6 @@ class FunctionTester:
                     )
 
             # Test defend
-            state = game_states.get("default")
             if state.combat:
                 result = defend()
                 self.assert_test(
@@ -292,7 +294,6 @@ class FunctionTester:
                 )
 
             # Test flee
-            state = game_states.get("default")
             if state.combat:
                 result = flee()
                 # Flee can fail, so just check it doesn't crash
@@ -428,9 +429,8 @@ class FunctionTester:
         self.log(f"Failed: {self.tests_failed} ❌")
         self.log(f"Pass Rate: {pass_rate:.1f}%")
 
-        # Save log to file
-        with open(self.log_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(self.test_log))
+        # Finish the log file
+        self._log_fh.close()
 
         self.log(f"\nLog saved to: {self.log_file}")
         self.log("=" * 80)
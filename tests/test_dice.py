@@ -2,8 +2,10 @@
 Test dice rolling system.
 """
 
+import random
+
 import pytest
-from systems.dice import roll_dice, roll_d20, roll_percentage
+from systems.dice import roll_dice, roll_d20, roll_percentage, parse_dice
 
 
 def test_roll_dice_simple():
@@ -21,12 +23,38 @@ def test_roll_dice_with_modifier():
     assert len(rolls) == 1
 
 
+@pytest.mark.parametrize("notation, low, high, count", [
+    ("1d4", 1, 4, 1),
+    ("2d6", 2, 12, 2),
+    ("3d8+2", 5, 26, 3),
+    ("1d20-5", 0, 15, 1),
+])
+def test_roll_dice_bounds(notation, low, high, count):
+    """Test rolls stay within the notation's range over many rolls"""
+    results = [roll_dice(notation) for _ in range(1_000)]
+    assert all(low <= total <= high and len(rolls) == count for total, rolls in results)
+
+
 def test_roll_dice_negative_modifier():
     """Test dice with negative modifiers"""
     total, rolls = roll_dice("1d8-2")
     assert 0 <= total <= 6  # max(0, 1-2) to max(0, 8-2)
 
 
+def test_parse_dice():
+    """Test dice notation parsing"""
+    assert parse_dice("2d6") == (2, 6, 0)
+    assert parse_dice("1D8+2") == (1, 8, 2)
+    assert parse_dice("3d4-1") == (3, 4, -1)
+    assert parse_dice("5") is None
+
+
+def test_roll_dice_plain_number():
+    """Test non-dice notation falls back to a fixed value"""
+    assert roll_dice("5") == (5, [])
+    assert roll_dice("nonsense") == (0, [])
+
+
 def test_roll_d20():
     """Test d20 rolls"""
     for _ in range(10):
@@ -34,6 +62,14 @@ def test_roll_d20():
         assert 1 <= result <= 20
 
 
+def test_roll_d20_distribution():
+    """Test d20 rolls cover every face with a sensible mean"""
+    random.seed(0)
+    results = [roll_d20() for _ in range(10_000)]
+    assert set(results) == set(range(1, 21))
+    assert 10.0 < sum(results) / len(results) < 11.0
+
+
 def test_roll_percentage():
     """Test percentage rolls"""
     for _ in range(10):
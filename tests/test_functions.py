@@ -0,0 +1,280 @@
+"""
+Test the game tools end to end, one isolated session per test.
+"""
+
+import uuid
+
+import pytest
+import game_tools
+from game_tools import (
+    create_character, view_status, explore, examine, move, attack, defend,
+    use_item, pickup, equip, rest, flee, game_states
+)
+from models.combat import Enemy
+from models.items import Weapon
+
+HERO_CLASSES = ["warrior", "mage", "rogue", "cleric"]
+
+
+@pytest.fixture
+def session_id():
+    """A fresh game session, discarded after the test"""
+    sid = uuid.uuid4().hex
+    yield sid
+    game_states.pop(sid, None)
+    game_tools._LAST_SAVE.pop(sid, None)
+
+
+@pytest.mark.parametrize("hero_class", HERO_CLASSES)
+def test_create_character(session_id, hero_class):
+    """Test character creation for each class"""
+    result = create_character(name=f"Test{hero_class.title()}", role=hero_class, session_id=session_id)
+
+    assert "error" not in result
+    assert "narrative" in result
+
+    state = game_states[session_id]
+    assert state.hero.name == f"Test{hero_class.title()}"
+    assert state.hero.role == hero_class
+
+
+@pytest.mark.parametrize("hero_class", HERO_CLASSES)
+def test_class_setup(session_id, hero_class):
+    """Test that each class starts with skills, equipment and resources"""
+    create_character(name=f"Class{hero_class.title()}", role=hero_class, session_id=session_id)
+    hero = game_states[session_id].hero
+
+    assert hero.skills
+    assert hero.equipped.weapon is not None
+    assert hero.uptime > 0 and hero.api_credits > 0
+
+
+@pytest.fixture
+def memory_saves(monkeypatch):
+    """Keep saves in memory instead of writing save files"""
+    store = game_tools.InMemorySaveStore()
+    monkeypatch.setattr(game_tools, "_save_store", store)
+    return store
+
+
+def test_save_and_load(session_id, memory_saves):
+    """Test that a saved game can be restored"""
+    create_character(name="SaveTester", role="mage", session_id=session_id)
+    state = game_states[session_id]
+    state.hero.gold = 50
+
+    save_id = game_tools.save_game(session_id=session_id)["state"]["save_id"]
+    assert memory_saves.exists(save_id)
+
+    state.hero.gold = 0
+    result = game_tools.load_game(save_id, session_id=session_id)
+
+    assert "error" not in result
+    assert game_states[session_id] is not state
+    assert game_states[session_id].hero.gold == 50
+
+
+def test_unchanged_save_is_not_rewritten(session_id, memory_saves):
+    """Test that saving an unchanged game reuses the previous save"""
+    create_character(name="SaveTwice", role="rogue", session_id=session_id)
+
+    first = game_tools.save_game(session_id=session_id)["state"]["save_id"]
+    assert game_tools.save_game(session_id=session_id)["state"]["save_id"] == first
+
+
+def test_saves_belong_to_their_session(session_id, memory_saves):
+    """Test that sessions saving at once get separate saves and can't load each other's"""
+    other_session = uuid.uuid4().hex
+    try:
+        create_character(name="Mine", role="mage", session_id=session_id)
+        create_character(name="Theirs", role="rogue", session_id=other_session)
+
+        mine = game_tools.save_game(session_id=session_id)["state"]["save_id"]
+        theirs = game_tools.save_game(session_id=other_session)["state"]["save_id"]
+
+        assert mine != theirs
+        assert "error" in game_tools.load_game(theirs, session_id=session_id)
+        assert game_states[session_id].hero.name == "Mine"
+    finally:
+        game_states.pop(other_session, None)
+        game_tools._LAST_SAVE.pop(other_session, None)
+
+
+def test_save_file_round_trip(session_id, tmp_path):
+    """Test that a save file restores the same game state"""
+    create_character(name="FileTester", role="cleric", session_id=session_id)
+    state = game_states[session_id]
+    store = game_tools.FileSaveStore(tmp_path)
+
+    store.put("save_test", store.dump(state))
+    loaded = store.get("save_test")
+
+    assert loaded.save_id == "save_test"
+    assert loaded.model_dump(exclude={"save_id"}) == state.model_dump(exclude={"save_id"})
+
+
+def test_latest_save_is_the_default_sessions(session_id, tmp_path, monkeypatch):
+    """Test that startup resumes the default session's newest save, not another session's"""
+    monkeypatch.setattr(game_tools, "_SAVES_DIR", tmp_path)
+    # load_latest_save resumes into the default session; put it back afterwards
+    monkeypatch.delitem(game_states, "default", raising=False)
+    store = game_tools.FileSaveStore(tmp_path)
+
+    for name, save_id in [
+        ("Legacy", "save_20240101_120000"),
+        ("Mine", f"{game_tools._save_prefix('default')}20250101_120000_000000"),
+        ("Theirs", f"{game_tools._save_prefix(session_id)}20260101_120000_000000"),
+    ]:
+        create_character(name=name, role="warrior", session_id=session_id)
+        store.put(save_id, store.dump(game_states[session_id]))
+    game_tools._wait_for_save(tmp_path / f"{save_id}.json")
+
+    assert game_tools.load_latest_save().hero.name == "Mine"
+
+
+def test_load_missing_save(session_id, memory_saves):
+    """Test loading a save id that doesn't exist"""
+    assert "error" in game_tools.load_game("save_missing", session_id=session_id)
+
+
+def test_exploration_actions(session_id):
+    """Test explore, view_status and examine"""
+    create_character(name="Explorer", role="warrior", session_id=session_id)
+
+    result = explore(session_id=session_id)
+    assert "error" not in result and "narrative" in result
+
+    result = view_status(session_id=session_id)
+    assert "error" not in result and "narrative" in result
+
+    room = game_states[session_id].get_current_room()
+    for target in [item.name for item in room.items] + [enemy.name for enemy in room.enemies]:
+        assert "error" not in examine(target=target, session_id=session_id)
+
+
+def test_item_management(session_id):
+    """Test pickup, equip and use_item"""
+    create_character(name="ItemTester", role="warrior", session_id=session_id)
+    state = game_states[session_id]
+    state.get_current_room().items.append(Weapon(
+        id="test_connector",
+        name="Test Connector",
+        description="A connector for tests",
+        tier="common",
+        damage_dice="1d6",
+        drop_rate=0.5
+    ))
+
+    assert "error" not in pickup(item="Test Connector", session_id=session_id)
+    assert "error" not in equip(item="Test Connector", session_id=session_id)
+    assert state.hero.equipped.weapon.id == "test_connector"
+
+    assert "error" not in use_item(item="Job Retry Potion", session_id=session_id)
+
+
+def test_equip_weapon_subclass(session_id):
+    """Test that subclasses of an equippable item go in their base item's slot"""
+    class Firmware(Weapon):
+        pass
+
+    create_character(name="Subclasser", role="warrior", session_id=session_id)
+    hero = game_states[session_id].hero
+    hero.add_to_inventory(Firmware(
+        id="firmware_blade",
+        name="Firmware Blade",
+        description="A very specific connector",
+        tier="rare",
+        damage_dice="2d6",
+        drop_rate=0.1
+    ))
+
+    assert "error" not in equip(item="Firmware Blade", session_id=session_id)
+    assert hero.equipped.weapon.id == "firmware_blade"
+
+
+def test_movement(session_id):
+    """Test moving to the next room"""
+    create_character(name="MoveTester", role="rogue", session_id=session_id)
+    state = game_states[session_id]
+    room = state.get_current_room()
+    room.enemies.clear()
+    room.is_cleared = True
+
+    result = move(direction="north", session_id=session_id)
+
+    assert "error" not in result
+    assert state.current_room_id == room.exits["north"]
+
+
+def test_combat_actions(session_id):
+    """Test attack, defend and flee against an enemy placed in the starting room"""
+    create_character(name="Combatant", role="warrior", session_id=session_id)
+    state = game_states[session_id]
+    room = state.get_current_room()
+    room.is_cleared = False
+    # Too tough to fall to one hit, so the fight is still on after the attack
+    room.add_enemies([Enemy(
+        id="test_gremlin",
+        name="Test Gremlin",
+        description="Lives in the test suite",
+        hp=999,
+        max_hp=999,
+        damage_dice="1d2",
+        xp_reward=1,
+        gold_reward=1,
+        loot_table="common",
+        tier="common"
+    )])
+
+    assert "error" not in attack(target="Test Gremlin", session_id=session_id)
+    assert state.combat
+    assert "error" not in defend(session_id=session_id)
+    # Fleeing can fail, it just mustn't error
+    assert "error" not in flee(session_id=session_id)
+
+
+def test_rest_action(session_id):
+    """Test resting outside combat"""
+    create_character(name="RestTester", role="cleric", session_id=session_id)
+    hero = game_states[session_id].hero
+    hero.uptime = hero.max_uptime // 2
+    hero.api_credits = hero.max_api_credits // 2
+
+    assert "error" not in rest(session_id=session_id)
+
+
+def test_sessions_are_isolated(session_id):
+    """Test that a second session doesn't see or change the first"""
+    other_session = uuid.uuid4().hex
+    try:
+        create_character(name="First", role="mage", session_id=session_id)
+        create_character(name="Second", role="rogue", session_id=other_session)
+
+        assert game_states[session_id].hero.name == "First"
+        assert game_states[other_session].hero.name == "Second"
+        assert "error" in view_status(session_id=uuid.uuid4().hex)
+    finally:
+        game_states.pop(other_session, None)
+
+
+def test_session_cache_evicts_idle_and_oldest_sessions():
+    """Test that idle and least recently used sessions are dropped, pinned ones kept"""
+    clock = [0.0]
+    evicted = []
+    cache = game_tools.SessionCache(
+        maxsize=3, ttl=10, pinned=("default",), timer=lambda: clock[0], on_evict=evicted.append
+    )
+    cache["default"] = "pinned"
+    cache["a"] = "first"
+    cache["b"] = "second"
+    cache["a"]
+    cache["c"] = "third"
+
+    assert set(cache) == {"default", "a", "c"}
+    assert evicted == ["b"]
+
+    clock[0] = 20
+    assert cache.get("a") is None
+    assert cache["default"] == "pinned"
+    assert evicted == ["b", "a"]
+
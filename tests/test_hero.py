@@ -0,0 +1,160 @@
+"""
+Test hero inventory and status effect handling.
+"""
+
+import pytest
+from models.hero import Hero, StatusEffect
+from models.items import Consumable, Weapon
+
+
+def create_test_hero():
+    """Create a test hero"""
+    return Hero(name="TestHero", role="rogue")
+
+
+def create_test_potion():
+    """Create a test consumable"""
+    return Consumable(
+        id="job_retry_potion",
+        name="Job Retry Potion",
+        description="Restore Uptime with a retry",
+        effect_type="heal_hp",
+        effect_value=50,
+        drop_rate=0.4
+    )
+
+
+def test_inventory_stacks_and_removes():
+    """Test adding, stacking, and removing inventory items"""
+    hero = create_test_hero()
+    potion = create_test_potion()
+
+    assert hero.add_to_inventory(potion)
+    assert hero.add_to_inventory(potion, quantity=2)
+    assert len(hero.inventory) == 1
+    assert hero.inventory[0].quantity == 3
+
+    assert hero.remove_from_inventory(potion.id, quantity=3)
+    assert hero.inventory == []
+    assert not hero.remove_from_inventory(potion.id)
+
+
+def test_inventory_index_rebuilt_on_load():
+    """Test that a reloaded hero can still find its items"""
+    hero = create_test_hero()
+    hero.add_to_inventory(create_test_potion(), quantity=2)
+
+    loaded = Hero.model_validate(hero.model_dump())
+    assert loaded.remove_from_inventory("job_retry_potion", quantity=2)
+    assert loaded.inventory == []
+
+
+def test_status_effects():
+    """Test adding and removing status effects"""
+    hero = create_test_hero()
+    effect = StatusEffect(
+        name="Cached",
+        effect_type="cached",
+        duration=3,
+        description="Responses are cached"
+    )
+
+    hero.add_status_effect(effect)
+    assert hero.has_status("Cached")
+    assert hero.get_armor_value() == 3
+
+    assert hero.remove_status_effect("Cached")
+    assert not hero.has_status("Cached")
+    assert hero.get_armor_value() == 0
+    assert not hero.remove_status_effect("Cached")
+
+
+def test_inventory_item_types_survive_round_trip():
+    """Test that reloaded inventory items keep their concrete types"""
+    hero = create_test_hero()
+    hero.add_to_inventory(create_test_potion())
+    hero.add_to_inventory(Weapon(
+        id="http_connector",
+        name="HTTP Connector",
+        description="A trusty connector",
+        tier="common",
+        damage_dice="1d6",
+        drop_rate=0.5
+    ))
+
+    loaded = Hero.model_validate_json(hero.model_dump_json())
+    assert [type(entry.item) for entry in loaded.inventory] == [Consumable, Weapon]
+
+
+def test_find_inventory():
+    """Test case-insensitive exact and partial inventory lookup"""
+    hero = create_test_hero()
+    potion = create_test_potion()
+    hero.add_to_inventory(potion)
+
+    assert hero.find_inventory("job retry potion").item is potion
+    assert hero.find_inventory("RETRY").item is potion
+    assert hero.find_inventory("retry", Weapon) is None
+    assert hero.find_inventory("sword") is None
+
+    hero.remove_from_inventory(potion.id)
+    assert hero.find_inventory("retry") is None
+
+
+def test_status_effects_load_from_list():
+    """Test that saves with the old list layout still load"""
+    hero = Hero.model_validate({
+        "name": "TestHero",
+        "role": "rogue",
+        "status_effects": [{
+            "name": "Cached",
+            "effect_type": "cached",
+            "duration": 2,
+            "description": "Responses are cached"
+        }]
+    })
+
+    assert hero.get_status_effect("cached").duration == 2
+    assert hero.get_armor_value() == 3
+
+
+def test_find_inventory_same_name_different_types():
+    """Test that stacks sharing a name can still be told apart by type"""
+    hero = create_test_hero()
+    potion = create_test_potion()
+    weapon = Weapon(
+        id="retry_blade",
+        name="Job Retry Potion",
+        description="Not actually a potion",
+        tier="common",
+        damage_dice="1d6",
+        drop_rate=0.5
+    )
+    hero.add_to_inventory(weapon)
+    hero.add_to_inventory(potion)
+
+    assert hero.find_inventory("job retry potion").item is weapon
+    assert hero.find_inventory("job retry potion", Consumable).item is potion
+    assert hero.find_inventory("retry", Consumable).item is potion
+
+    hero.remove_from_inventory(weapon.id)
+    assert hero.find_inventory("job retry potion").item is potion
+
+
+def test_status_effects_rekeyed_by_effect_type():
+    """Test that a save whose keys don't match its effects is keyed by the effects"""
+    hero = Hero.model_validate({
+        "name": "TestHero",
+        "role": "rogue",
+        "status_effects": {"cached": {
+            "name": "Buffered",
+            "effect_type": "buffered",
+            "duration": 2,
+            "description": "Requests are buffered"
+        }}
+    })
+
+    assert hero.get_status_effect("cached") is None
+    assert hero.get_status_effect("buffered").duration == 2
+    assert hero.remove_status_effect("Buffered")
+    assert hero.status_effects == {}